@@ -24,6 +24,10 @@ class EnhancedWebSearchAI:
         self.discord_bot = discord_bot
         self.guild_id = guild_id
 
+        # Provider calls go through the bot's shared aiohttp session; a
+        # per-call ClientSession would pay TCP + TLS setup on every request
+        self._session = getattr(discord_bot, "_aiohttp_main_client_session", None)
+
         # Available AI models with tool calling capabilities
         self.capable_models = {
             "openai": {
@@ -57,6 +61,14 @@ class EnhancedWebSearchAI:
             f"Enhanced Web Search AI initialized with {len(self.available_models)} available providers"
         )
 
+    def _require_session(self) -> aiohttp.ClientSession:
+        """Return the bot's shared aiohttp session for provider calls."""
+        if self._session is None:
+            raise Exception(
+                "aiohttp client session is not initialized; cannot perform HTTP requests."
+            )
+        return self._session
+
     async def process_web_search_request(
         self, query: str, search_results: Dict[str, Any]
     ) -> str:
@@ -170,13 +182,13 @@ Search Results: {json.dumps(search_results, indent=2)}""",
         base_url = config["base_url"] or "https://api.openai.com"
         url = f"{base_url}/v1/chat/completions"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=data) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result["choices"][0]["message"]["content"]
-                else:
-                    raise Exception(f"OpenAI API error: {response.status}")
+        session = self._require_session()
+        async with session.post(url, headers=headers, json=data) as response:
+            if response.status == 200:
+                result = await response.json()
+                return result["choices"][0]["message"]["content"]
+            else:
+                raise Exception(f"OpenAI API error: {response.status}")
 
     async def _call_anthropic_model(
         self, config: Dict[str, Any], query: str, search_results: Dict[str, Any]
@@ -230,25 +242,23 @@ Search Results: {json.dumps(search_results, indent=2)}""",
 
         url = f"{config['base_url']}/v1/messages"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=data) as response:
-                if response.status == 200:
-                    result = await response.json()
+        session = self._require_session()
+        async with session.post(url, headers=headers, json=data) as response:
+            if response.status == 200:
+                result = await response.json()
 
-                    # Extract the generated text from Claude's response
-                    if "content" in result and len(result["content"]) > 0:
-                        content_block = result["content"][0]
-                        if "text" in content_block:
-                            return content_block["text"]
+                # Extract the generated text from Claude's response
+                if "content" in result and len(result["content"]) > 0:
+                    content_block = result["content"][0]
+                    if "text" in content_block:
+                        return content_block["text"]
 
-                    # Fallback if response structure is unexpected
-                    logging.warning(f"Unexpected Claude response structure: {result}")
-                    raise Exception("Unexpected response structure from Claude API")
-                else:
-                    error_text = await response.text()
-                    raise Exception(
-                        f"Claude API error: {response.status} - {error_text}"
-                    )
+                # Fallback if response structure is unexpected
+                logging.warning(f"Unexpected Claude response structure: {result}")
+                raise Exception("Unexpected response structure from Claude API")
+            else:
+                error_text = await response.text()
+                raise Exception(f"Claude API error: {response.status} - {error_text}")
 
     async def _call_google_model(
         self, config: Dict[str, Any], query: str, search_results: Dict[str, Any]
@@ -326,51 +336,49 @@ Search Results: {json.dumps(search_results, indent=2)}"""
         model_name = config["models"][0]
         url = f"{config['base_url']}/v1beta/models/{model_name}:generateContent?key={config['api_key']}"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=data) as response:
-                if response.status == 200:
-                    result = await response.json()
-
-                    # Extract the generated text from Gemini's response
-                    if "candidates" in result and len(result["candidates"]) > 0:
-                        candidate = result["candidates"][0]
-
-                        # Check if we have content with parts
-                        if "content" in candidate and "parts" in candidate["content"]:
-                            parts = candidate["content"]["parts"]
-                            if len(parts) > 0 and "text" in parts[0]:
-                                return parts[0]["text"]
-
-                        # Check if we have direct content
-                        elif "content" in candidate and isinstance(
-                            candidate["content"], str
-                        ):
-                            return candidate["content"]
-
-                        # Check if content is empty due to token limits
-                        elif (
-                            "content" in candidate
-                            and candidate["content"].get("role") == "model"
-                        ):
-                            if candidate.get("finishReason") == "MAX_TOKENS":
-                                logging.warning(
-                                    "Gemini hit token limit, using fallback processing"
-                                )
-                                return None  # This will trigger fallback processing
-                            else:
-                                logging.warning(
-                                    f"Gemini response has no content: {candidate}"
-                                )
-                                return None
-
-                    # Fallback if response structure is unexpected
-                    logging.warning(f"Unexpected Gemini response structure: {result}")
-                    return None  # Return None instead of raising exception to trigger fallback
-                else:
-                    error_text = await response.text()
-                    raise Exception(
-                        f"Gemini API error: {response.status} - {error_text}"
-                    )
+        session = self._require_session()
+        async with session.post(url, headers=headers, json=data) as response:
+            if response.status == 200:
+                result = await response.json()
+
+                # Extract the generated text from Gemini's response
+                if "candidates" in result and len(result["candidates"]) > 0:
+                    candidate = result["candidates"][0]
+
+                    # Check if we have content with parts
+                    if "content" in candidate and "parts" in candidate["content"]:
+                        parts = candidate["content"]["parts"]
+                        if len(parts) > 0 and "text" in parts[0]:
+                            return parts[0]["text"]
+
+                    # Check if we have direct content
+                    elif "content" in candidate and isinstance(
+                        candidate["content"], str
+                    ):
+                        return candidate["content"]
+
+                    # Check if content is empty due to token limits
+                    elif (
+                        "content" in candidate
+                        and candidate["content"].get("role") == "model"
+                    ):
+                        if candidate.get("finishReason") == "MAX_TOKENS":
+                            logging.warning(
+                                "Gemini hit token limit, using fallback processing"
+                            )
+                            return None  # This will trigger fallback processing
+                        else:
+                            logging.warning(
+                                f"Gemini response has no content: {candidate}"
+                            )
+                            return None
+
+                # Fallback if response structure is unexpected
+                logging.warning(f"Unexpected Gemini response structure: {result}")
+                return None  # Return None instead of raising exception to trigger fallback
+            else:
+                error_text = await response.text()
+                raise Exception(f"Gemini API error: {response.status} - {error_text}")
 
     async def _fallback_processing(
         self, query: str, search_results: Dict[str, Any]
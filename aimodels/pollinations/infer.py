@@ -21,6 +21,46 @@ from core.services.helperfunctions import HelperFunctions
 from core.services.auto_return_manager import AutoReturnManager
 from tools.ExaSearch.tool import extract_clean_query
 
+# Web search detection keywords for the fallback tool detector - these should
+# route to a more capable AI model. Module-level so tests and other callers
+# can inspect them without source scanning.
+WEB_SEARCH_KEYWORDS = (
+    "what's the latest",
+    "latest news",
+    "current events",
+    "recent updates",
+    "what games are playing",
+    "what football games are playing",
+    "sports schedule",
+    "game times",
+    "who's playing",
+    "what happened today",
+    "breaking news",
+    "live updates",
+    "current status",
+    "what's happening",
+    "latest information",
+    "recent developments",
+    "search for",
+    "find information about",
+    "look up",
+    "research",
+    "what's new",
+    "latest updates",
+    "current situation",
+    "recent changes",
+    "sports news",
+    "game results",
+    "match updates",
+    "tournament standings",
+    "playoff schedule",
+    "season updates",
+    "team news",
+    "player stats",
+    "live scores",
+    "game highlights",
+)
+
 
 class Completions(ModelParams):
     def __init__(self, model_name, discord_ctx, discord_bot, guild_id: int = None):
@@ -141,46 +181,8 @@ class Completions(ModelParams):
 
         content = last_message["content"].lower()
 
-        # Web search detection - these should use a more capable AI model
-        web_search_keywords = [
-            "what's the latest",
-            "latest news",
-            "current events",
-            "recent updates",
-            "what games are playing",
-            "what football games are playing",
-            "sports schedule",
-            "game times",
-            "who's playing",
-            "what happened today",
-            "breaking news",
-            "live updates",
-            "current status",
-            "what's happening",
-            "latest information",
-            "recent developments",
-            "search for",
-            "find information about",
-            "look up",
-            "research",
-            "what's new",
-            "latest updates",
-            "current situation",
-            "recent changes",
-            "sports news",
-            "game results",
-            "match updates",
-            "tournament standings",
-            "playoff schedule",
-            "season updates",
-            "team news",
-            "player stats",
-            "live scores",
-            "game highlights",
-        ]
-
         # Check if this is a web search request that needs a more capable AI model
-        if any(keyword in content for keyword in web_search_keywords):
+        if any(keyword in content for keyword in WEB_SEARCH_KEYWORDS):
             return {
                 "tool": "ExaSearch",
                 "function": "_tool_function",
@@ -5,7 +5,7 @@ import asyncio
 import random
 import yaml
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from core.services.database_manager import DatabaseManager
 
 
@@ -103,7 +103,7 @@ class Engagement(commands.Cog):
                         "$set": {
                             "guild_id": guild_id,
                             "channel_id": channel_id,
-                            "engaged_at": datetime.utcnow(),
+                            "engaged_at": datetime.now(timezone.utc),
                             "engaged_by": "system",
                         }
                     },
@@ -170,7 +170,7 @@ class Engagement(commands.Cog):
     async def _interject_in_channel(self, channel: discord.TextChannel):
         """Send a random interjection message to the channel if conditions are met."""
         # Check if enough time has passed since last message
-        current_time = datetime.utcnow()
+        current_time = datetime.now(timezone.utc)
         last_time = self.last_message_times.get(channel.id)
 
         if last_time:
@@ -313,7 +313,7 @@ class Engagement(commands.Cog):
             title="🎰 Jakey's Active Engagements",
             description=f"Servers where Jakey is actively participating ({len(self.active_channels)} total):",
             color=0x00FF00,
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
         )
 
         for guild_id, channel_id in self.active_channels.items():
@@ -339,7 +339,7 @@ class Engagement(commands.Cog):
         embed = discord.Embed(
             title="📊 Jakey Engagement Statistics",
             color=0x0099FF,
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
         )
 
         # Current engagement stats
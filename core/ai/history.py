@@ -18,6 +18,10 @@ else:
     # Fallback to pollinations::evil if environment variable is not set or invalid
     DEFAULT_MODEL = "pollinations::evil"
 
+# Fact queries only consume fact_text (plus expires_at for the staleness
+# check); projecting away the rest keeps full documents off the wire
+_FACT_PROJECTION = {"fact_text": 1, "expires_at": 1, "_id": 0}
+
 
 # A class that is responsible for managing and manipulating the chat history
 class History:
@@ -210,6 +214,38 @@ class History:
     # Knowledge Base Management
     ####################################################################################
 
+    async def _ensure_knowledge_indexes(self, guild_id: str, knowledge_collection):
+        """Create a guild's knowledge indexes once per process.
+
+        Besides the text index used by fact search, this adds a TTL index on
+        expires_at (expireAfterSeconds=0) so the server purges expired facts
+        itself instead of every query filtering them out per document.
+        Documents whose expires_at is null are never auto-deleted.
+        """
+        if guild_id in self._knowledge_indexes:
+            return
+        try:
+            await knowledge_collection.create_index([("fact_text", "text")])
+            await knowledge_collection.create_index(
+                [("expires_at", 1)], expireAfterSeconds=0
+            )
+            # Serves the list-facts prioritization (filter by user, read
+            # fact_text) straight from the index
+            await knowledge_collection.create_index([("user_id", 1), ("fact_text", 1)])
+            # Equality lookups on the structured category field
+            await knowledge_collection.create_index([("category", 1)])
+            # Recency walk for get_recent_facts; without it the sort runs
+            # in memory and degrades once a guild's facts outgrow the
+            # server's sort budget
+            await knowledge_collection.create_index(
+                [("last_accessed_at", -1)], background=True
+            )
+            self._knowledge_indexes.add(guild_id)
+        except Exception as e:
+            logging.warning(
+                f"Failed to create knowledge indexes for guild {guild_id}: {e}"
+            )
+
     async def add_fact(
         self,
         guild_id: int,
@@ -217,6 +253,7 @@ class History:
         fact_text: str,
         source: str,
         expires_at: datetime = None,
+        category: str = None,
     ):
         """Store a fact in the knowledge base with expiration"""
         guild_id = self._normalize_guild_id(guild_id)
@@ -226,6 +263,7 @@ class History:
             "user_id": user_id,
             "fact_text": fact_text,
             "source": source,
+            "category": category,
             "created_at": datetime.now(timezone.utc),
             "last_accessed_at": datetime.now(timezone.utc),
             "relevance_score": 0,  # Default relevance score
@@ -234,6 +272,43 @@ class History:
         result = await knowledge_collection.insert_one(fact)
         return result.inserted_id
 
+    async def add_facts(
+        self,
+        guild_id: int,
+        user_id: int,
+        fact_texts: list,
+        source: str,
+        expires_at: datetime = None,
+        category: str = None,
+    ):
+        """Store several facts in one bulk insert.
+
+        A single unordered insert_many pays one round-trip for the whole
+        batch, where per-fact add_fact calls pay one each; callers that
+        extract multiple facts in one turn should prefer this.
+        """
+        if not fact_texts:
+            return []
+        guild_id = self._normalize_guild_id(guild_id)
+        knowledge_collection = self._db[f"knowledge_{guild_id}"]
+
+        now = datetime.now(timezone.utc)
+        facts = [
+            {
+                "user_id": user_id,
+                "fact_text": fact_text,
+                "source": source,
+                "category": category,
+                "created_at": now,
+                "last_accessed_at": now,
+                "relevance_score": 0,  # Default relevance score
+                "expires_at": expires_at,
+            }
+            for fact_text in fact_texts
+        ]
+        result = await knowledge_collection.insert_many(facts, ordered=False)
+        return result.inserted_ids
+
     async def add_reminder(
         self,
         guild_id: int,
@@ -266,10 +341,10 @@ class History:
 
         reminders_collection = self._db[collection_name]
         now = datetime.now(timezone.utc)
-        due_reminders = []
-        async for reminder in reminders_collection.find({"remind_time": {"$lte": now}}):
-            due_reminders.append(reminder)
-        return due_reminders
+        # One awaitable for the whole batch instead of a loop tick per doc
+        return await reminders_collection.find(
+            {"remind_time": {"$lte": now}}
+        ).to_list(length=None)
 
     async def delete_reminder(self, guild_id: int, reminder_id):
         """Remove a reminder from the database"""
@@ -304,26 +379,21 @@ class History:
 
         knowledge_collection = self._db[collection_name]
         results = []
+        # One timestamp for the whole call instead of one per document
+        now = datetime.now(timezone.utc)
 
         try:
             # First try: Text search with MongoDB text index
-            if guild_id not in self._knowledge_indexes:
-                try:
-                    await knowledge_collection.create_index([("fact_text", "text")])
-                    self._knowledge_indexes.add(guild_id)
-                except Exception as e:
-                    logging.warning(
-                        f"Failed to create text index for guild {guild_id}: {e}"
-                    )
+            await self._ensure_knowledge_indexes(guild_id, knowledge_collection)
 
             # Try text search first
             try:
                 async for fact in knowledge_collection.find(
-                    {"$text": {"$search": query}}
+                    {"$text": {"$search": query}}, _FACT_PROJECTION
                 ).limit(limit):
                     if fact and (
                         fact.get("expires_at") is None
-                        or fact["expires_at"] > datetime.now(timezone.utc)
+                        or fact["expires_at"] > now
                     ):
                         results.append(fact["fact_text"])
             except Exception as e:
@@ -336,11 +406,11 @@ class History:
                     regex_pattern = re.compile(re.escape(query), re.IGNORECASE)
 
                     async for fact in knowledge_collection.find(
-                        {"fact_text": {"$regex": regex_pattern}}
+                        {"fact_text": {"$regex": regex_pattern}}, _FACT_PROJECTION
                     ).limit(limit - len(results)):
                         if fact and (
                             fact.get("expires_at") is None
-                            or fact["expires_at"] > datetime.now(timezone.utc)
+                            or fact["expires_at"] > now
                         ):
                             fact_text = fact["fact_text"]
                             if fact_text not in results:  # Avoid duplicates
@@ -359,11 +429,12 @@ class History:
                             word_pattern = re.compile(re.escape(word), re.IGNORECASE)
 
                             async for fact in knowledge_collection.find(
-                                {"fact_text": {"$regex": word_pattern}}
+                                {"fact_text": {"$regex": word_pattern}},
+                                _FACT_PROJECTION,
                             ).limit(limit - len(results)):
                                 if fact and (
                                     fact.get("expires_at") is None
-                                    or fact["expires_at"] > datetime.now(timezone.utc)
+                                    or fact["expires_at"] > now
                                 ):
                                     fact_text = fact["fact_text"]
                                     if fact_text not in results:  # Avoid duplicates
@@ -392,16 +463,19 @@ class History:
 
         knowledge_collection = self._db[collection_name]
         facts = []
+        now = datetime.now(timezone.utc)
 
         try:
-            async for fact in knowledge_collection.find({"user_id": user_id}).limit(
-                limit
-            ):
-                if fact and (
-                    fact.get("expires_at") is None
-                    or fact["expires_at"] > datetime.now(timezone.utc)
-                ):
-                    facts.append(fact["fact_text"])
+            # to_list pulls the batch in one awaitable instead of scheduling
+            # an event-loop tick per document
+            docs = await knowledge_collection.find(
+                {"user_id": user_id}, _FACT_PROJECTION
+            ).to_list(length=limit)
+            facts = [
+                fact["fact_text"]
+                for fact in docs
+                if fact.get("expires_at") is None or fact["expires_at"] > now
+            ]
         except Exception as e:
             logging.error(f"Failed to get facts by user for guild {guild_id}: {e}")
 
@@ -417,16 +491,19 @@ class History:
 
         knowledge_collection = self._db[collection_name]
         facts = []
+        now = datetime.now(timezone.utc)
 
         try:
-            async for fact in (
-                knowledge_collection.find().sort("last_accessed_at", -1).limit(limit)
-            ):
-                if fact and (
-                    fact.get("expires_at") is None
-                    or fact["expires_at"] > datetime.now(timezone.utc)
-                ):
-                    facts.append(fact["fact_text"])
+            docs = await (
+                knowledge_collection.find({}, _FACT_PROJECTION)
+                .sort("last_accessed_at", -1)
+                .to_list(length=limit)
+            )
+            facts = [
+                fact["fact_text"]
+                for fact in docs
+                if fact.get("expires_at") is None or fact["expires_at"] > now
+            ]
         except Exception as e:
             logging.error(f"Failed to get recent facts for guild {guild_id}: {e}")
 
@@ -510,8 +587,11 @@ class History:
                     f"No existing text index to drop for {collection_name}: {e}"
                 )
 
-            # Create new text index
+            # Create new text index plus the TTL index on expires_at
             await knowledge_collection.create_index([("fact_text", "text")])
+            await knowledge_collection.create_index(
+                [("expires_at", 1)], expireAfterSeconds=0
+            )
             logging.info(f"Created new text index for {collection_name}")
 
             # Reset the knowledge indexes set
@@ -575,26 +655,22 @@ class History:
 
         knowledge_collection = self._db[collection_name]
         results = []
+        # One timestamp for the whole call instead of one per document
+        now = datetime.now(timezone.utc)
 
         try:
-            # Create text index if it doesn't exist
-            if guild_id not in self._knowledge_indexes:
-                try:
-                    await knowledge_collection.create_index([("fact_text", "text")])
-                    self._knowledge_indexes.add(guild_id)
-                except Exception as e:
-                    logging.warning(
-                        f"Failed to create text index for guild {guild_id}: {e}"
-                    )
+            # Create the knowledge indexes if they don't exist
+            await self._ensure_knowledge_indexes(guild_id, knowledge_collection)
 
             # Try text search first (user-specific)
             try:
                 async for fact in knowledge_collection.find(
-                    {"$text": {"$search": query}, "user_id": user_id}
+                    {"$text": {"$search": query}, "user_id": user_id},
+                    _FACT_PROJECTION,
                 ).limit(limit):
                     if fact and (
                         fact.get("expires_at") is None
-                        or fact["expires_at"] > datetime.now(timezone.utc)
+                        or fact["expires_at"] > now
                     ):
                         results.append(fact["fact_text"])
             except Exception as e:
@@ -609,11 +685,12 @@ class History:
                     regex_pattern = re.compile(re.escape(query), re.IGNORECASE)
 
                     async for fact in knowledge_collection.find(
-                        {"fact_text": {"$regex": regex_pattern}, "user_id": user_id}
+                        {"fact_text": {"$regex": regex_pattern}, "user_id": user_id},
+                        _FACT_PROJECTION,
                     ).limit(limit - len(results)):
                         if fact and (
                             fact.get("expires_at") is None
-                            or fact["expires_at"] > datetime.now(timezone.utc)
+                            or fact["expires_at"] > now
                         ):
                             fact_text = fact["fact_text"]
                             if fact_text not in results:  # Avoid duplicates
@@ -641,7 +718,7 @@ class History:
                             ).limit(limit - len(results)):
                                 if fact and (
                                     fact.get("expires_at") is None
-                                    or fact["expires_at"] > datetime.now(timezone.utc)
+                                    or fact["expires_at"] > now
                                 ):
                                     fact_text = fact["fact_text"]
                                     if fact_text not in results:  # Avoid duplicates
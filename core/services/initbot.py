@@ -76,8 +76,18 @@ class ServicesInitBot(bridge.Bot):
             self._openai_client_groq = None
             logging.warning("GROQ_API_KEY not set; Groq models disabled.")
 
-        # Everything else (mostly GET requests)
-        self._aiohttp_main_client_session = aiohttp.ClientSession(loop=self.loop)
+        # Everything else (mostly GET requests). Tune the connector so the
+        # shared session pools connections and caches DNS lookups instead of
+        # re-resolving per request.
+        self._aiohttp_main_client_session = aiohttp.ClientSession(
+            loop=self.loop,
+            connector=aiohttp.TCPConnector(
+                loop=self.loop,
+                limit=100,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+            ),
+        )
         logging.info("aiohttp client session initialized successfully")
 
         # Azure Blob Storage Client
@@ -37,6 +37,17 @@ class InputValidator:
     MAX_FILENAME_LENGTH = 100
     MAX_URL_LENGTH = 2048
 
+    # Dangerous content as a single alternation so one pass covers all cases.
+    # No word anchors or attribute bounds: the protocol markers must match as
+    # substrings (xjavascript: is still dangerous) and script tags can carry
+    # arbitrarily long attribute lists. The branches are all literal-headed,
+    # so the alternation cannot backtrack pathologically.
+    DANGEROUS_CONTENT_PATTERN = (
+        r"<script\b[^>]*>.*?</script>"  # Script tags
+        r"|(?:java|vb)script:"  # JavaScript/VBScript protocols
+        r"|data:text/html"  # Data URLs
+    )
+
     def __init__(self):
         self.compiled_patterns = {
             "discord_user_id": re.compile(self.DISCORD_USER_ID_PATTERN),
@@ -45,6 +56,9 @@ class InputValidator:
             "discord_mention": re.compile(self.DISCORD_MENTION_PATTERN),
             "url": re.compile(self.URL_PATTERN),
             "image_url": re.compile(self.IMAGE_URL_PATTERN),
+            "dangerous_content": re.compile(
+                self.DANGEROUS_CONTENT_PATTERN, re.IGNORECASE
+            ),
         }
 
     def validate_discord_id(self, value: Any, id_type: str = "user") -> str:
@@ -219,20 +233,12 @@ class InputValidator:
             raise ValidationError("Message content cannot be empty", field="content")
 
         # Check for potentially dangerous content
-        dangerous_patterns = [
-            r"<script[^>]*>.*?</script>",  # Script tags
-            r"javascript:",  # JavaScript protocol
-            r"data:text/html",  # Data URLs
-            r"vbscript:",  # VBScript protocol
-        ]
-
-        for pattern in dangerous_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                raise ValidationError(
-                    "Message content contains potentially dangerous content",
-                    field="content",
-                    value=content[:100] + "..." if len(content) > 100 else content,
-                )
+        if self.compiled_patterns["dangerous_content"].search(content):
+            raise ValidationError(
+                "Message content contains potentially dangerous content",
+                field="content",
+                value=content[:100] + "..." if len(content) > 100 else content,
+            )
 
         return content
 
@@ -0,0 +1,121 @@
+"""
+Reliability helpers for outbound HTTP calls
+
+This module provides small building blocks tools can wrap around their
+aiohttp requests so transient upstream flakiness (connection resets,
+timeouts, 429/5xx responses) doesn't surface as hard failures to users.
+"""
+
+import aiohttp
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict
+
+# Statuses worth retrying: rate limiting and server-side errors. 4xx auth or
+# validation failures are deterministic and must propagate immediately.
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class TransientHTTPError(Exception):
+    """Marks a retryable HTTP status (429 or 5xx) inside a retried operation."""
+
+    def __init__(self, status: int, reason: str = None):
+        super().__init__(f"HTTP {status}: {reason or 'upstream error'}")
+        self.status = status
+        self.reason = reason
+
+
+async def retry_with_backoff(
+    operation,
+    attempts: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 5.0,
+    description: str = "HTTP request",
+):
+    """Run an async operation, retrying transient failures with full jitter.
+
+    Retries ``aiohttp.ClientConnectionError``, ``asyncio.TimeoutError``, and
+    ``TransientHTTPError`` up to *attempts* times, sleeping a random delay in
+    ``[0, min(max_delay, base_delay * 2**attempt)]`` between tries. Any other
+    exception propagates immediately, as does the last error once the retry
+    budget is exhausted.
+    """
+    for attempt in range(attempts):
+        try:
+            return await operation()
+        except (
+            aiohttp.ClientConnectionError,
+            asyncio.TimeoutError,
+            TransientHTTPError,
+        ) as e:
+            if attempt == attempts - 1:
+                raise
+            delay = random.uniform(0.0, min(max_delay, base_delay * (2**attempt)))
+            logging.warning(
+                "%s failed (%s); retrying in %.2fs (attempt %d of %d)",
+                description,
+                e,
+                delay,
+                attempt + 1,
+                attempts,
+            )
+            await asyncio.sleep(delay)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the host's circuit is open."""
+
+
+@dataclass
+class CircuitBreaker:
+    """Per-host CLOSED/OPEN/HALF_OPEN circuit breaker.
+
+    After *failure_threshold* consecutive failures the breaker opens and
+    calls fail fast for *reset_timeout* seconds, converting long upstream
+    timeouts into immediate cheap errors. The first call after the timeout
+    probes the host (half-open); its outcome re-closes or re-opens the
+    circuit.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    fail_count: int = 0
+    opened_at: float = 0.0
+    state: str = "closed"
+
+    def allow(self) -> bool:
+        """Return whether a call may proceed, moving to half-open if due."""
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = "half_open"
+        return True
+
+    def record_success(self):
+        self.fail_count = 0
+        self.state = "closed"
+
+    def record_failure(self):
+        self.fail_count += 1
+        if self.state == "half_open" or self.fail_count >= self.failure_threshold:
+            self.state = "open"
+            self.opened_at = time.monotonic()
+            logging.warning(
+                "Circuit breaker opened after %d consecutive failures", self.fail_count
+            )
+
+
+# Breakers are shared process-wide so every Tool instance (recreated per
+# invocation) observes the same upstream health
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """Return the process-wide circuit breaker for *host*, creating it lazily."""
+    breaker = _breakers.get(host)
+    if breaker is None:
+        breaker = _breakers[host] = CircuitBreaker()
+    return breaker
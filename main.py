@@ -52,6 +52,15 @@ from core.services.auto_return_manager import AutoReturnManager
 # Go to project root directory
 chdir(Path(__file__).parent.resolve())
 
+# Use uvloop as the asyncio event-loop policy when available (not on Windows)
+try:
+    import uvloop
+
+    uvloop.install()
+    logging.info("uvloop event loop policy installed")
+except ImportError:
+    logging.info("uvloop not available, using default asyncio event loop")
+
 # Load environment variables
 dotenv.load_dotenv("dev.env")
 
@@ -349,16 +358,18 @@ async def on_message(message: discord.Message):
 
 with open("commands.yaml", "r") as file:
     cog_commands = yaml.safe_load(file)
-    for command in cog_commands:
-        try:
-            bot.load_extension(f"cogs.{command}")
-        except Exception as e:
+    # Bulk load all cogs in one call; store=True collects per-cog failures
+    # instead of raising, matching the old skip-and-continue behavior.
+    _load_status = bot.load_extensions(
+        *(f"cogs.{command}" for command in cog_commands), store=True
+    )
+    for _cog_name, _status in (_load_status or {}).items():
+        if _status is not True:
             logging.error(
-                "cogs.%s failed to load, skipping... The following error of the cog: %s",
-                command,
-                e,
+                "%s failed to load, skipping... The following error of the cog: %s",
+                _cog_name,
+                _status,
             )
-            continue
 
 
 # Initialize custom help
@@ -25,10 +25,15 @@ logging.basicConfig(
 )
 
 
+def _emit(lines):
+    """Write a block of output in one buffered call instead of one print per line."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 async def flush_old_memories():
     """Flush old memory format from the database."""
-    print("🧠 Jakey Memory Format Cleanup")
-    print("=" * 50)
+    _emit(["🧠 Jakey Memory Format Cleanup", "=" * 50])
 
     try:
         # Import required modules
@@ -64,46 +69,51 @@ async def flush_old_memories():
             if not guild_id:
                 continue
 
-            print(f"\n🏠 Processing guild: {guild_id}")
+            guild_lines = [f"\n🏠 Processing guild: {guild_id}"]
 
             # Check knowledge collection for this guild
             knowledge_collection_name = f"knowledge_{guild_id}"
             if knowledge_collection_name in await db.list_collection_names():
                 knowledge_collection = db[knowledge_collection_name]
 
-                # Find old format memories (without user_id or with old structure)
-                old_memories = []
-
-                # Look for memories without user_id field (old format)
-                async for memory in knowledge_collection.find(
-                    {"user_id": {"$exists": False}}
-                ):
-                    old_memories.append(memory)
-
-                # Look for memories with old text format (without [Username] prefix)
-                async for memory in knowledge_collection.find(
-                    {
-                        "user_id": {"$exists": True},
-                        "fact_text": {"$not": {"$regex": r"^\[.*?\]"}},
-                    }
-                ):
-                    old_memories.append(memory)
+                # Find old format memories (without user_id or with old structure).
+                # The two lookups are independent, so run them concurrently.
+                missing_user_id, old_text_format = await asyncio.gather(
+                    # Memories without user_id field (old format)
+                    knowledge_collection.find(
+                        {"user_id": {"$exists": False}}
+                    ).to_list(None),
+                    # Memories with old text format (without [Username] prefix)
+                    knowledge_collection.find(
+                        {
+                            "user_id": {"$exists": True},
+                            "fact_text": {"$not": {"$regex": r"^\[.*?\]"}},
+                        }
+                    ).to_list(None),
+                )
+                old_memories = missing_user_id + old_text_format
 
                 if old_memories:
-                    print(f"  🧹 Found {len(old_memories)} old format memories")
+                    guild_lines.append(
+                        f"  🧹 Found {len(old_memories)} old format memories"
+                    )
 
                     # Delete old memories
                     result = await knowledge_collection.delete_many(
                         {"_id": {"$in": [mem["_id"] for mem in old_memories]}}
                     )
 
-                    print(f"  ✅ Deleted {result.deleted_count} old memories")
+                    guild_lines.append(
+                        f"  ✅ Deleted {result.deleted_count} old memories"
+                    )
                     total_old_memories += result.deleted_count
                     total_cleaned_guilds += 1
                 else:
-                    print(f"  ✅ No old format memories found")
+                    guild_lines.append("  ✅ No old format memories found")
             else:
-                print(f"  ℹ️  No knowledge collection found")
+                guild_lines.append("  ℹ️  No knowledge collection found")
+
+            _emit(guild_lines)
 
         # Clean up any orphaned knowledge collections
         print(f"\n🧹 Cleaning up orphaned knowledge collections...")
@@ -132,22 +142,27 @@ async def flush_old_memories():
             print(f"  ✅ No orphaned collections found")
 
         # Summary
-        print(f"\n" + "=" * 50)
-        print(f"🎉 Memory Cleanup Complete!")
-        print(f"📊 Results:")
-        print(f"   • Total old memories removed: {total_old_memories}")
-        print(f"   • Guilds cleaned: {total_cleaned_guilds}")
-        print(f"   • Orphaned collections removed: {len(orphaned_collections)}")
+        summary_lines = [
+            "\n" + "=" * 50,
+            "🎉 Memory Cleanup Complete!",
+            "📊 Results:",
+            f"   • Total old memories removed: {total_old_memories}",
+            f"   • Guilds cleaned: {total_cleaned_guilds}",
+            f"   • Orphaned collections removed: {len(orphaned_collections)}",
+        ]
 
         if total_old_memories > 0:
-            print(f"\n✅ Successfully cleaned up old memory format!")
-            print(
-                f"   Jakey's memory system is now using the new user-specific format."
-            )
-            print(f"   All memories will now be properly associated with users.")
+            summary_lines += [
+                "\n✅ Successfully cleaned up old memory format!",
+                "   Jakey's memory system is now using the new user-specific format.",
+                "   All memories will now be properly associated with users.",
+            ]
         else:
-            print(f"\n✅ No old format memories were found!")
-            print(f"   Jakey's memory system is already using the new format.")
+            summary_lines += [
+                "\n✅ No old format memories were found!",
+                "   Jakey's memory system is already using the new format.",
+            ]
+        _emit(summary_lines)
 
         return True
 
@@ -0,0 +1,8 @@
+"""Shared pytest configuration: put the project root on sys.path once."""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
@@ -5,13 +5,7 @@ Tests that the reduced sensitivity configuration works correctly
 """
 
 import sys
-import os
 import logging
-from pathlib import Path
-
-# Add the project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -69,19 +63,27 @@ def test_exasearch_config():
             "game schedule today"
         ]
         
-        logger.info("\n--- Testing Non-Triggering Queries (should be low confidence) ---")
-        for query in non_triggering_queries:
-            analysis = analyzer.analyze_query(query)
-            confidence = analysis.get("confidence", 0)
-            query_type = analysis.get("query_type", "general")
-            logger.info(f"Query: '{query}' -> Type: {query_type}, Confidence: {confidence:.2f}")
-            
-        logger.info("\n--- Testing Triggering Queries (should be high confidence) ---")
-        for query in triggering_queries:
-            analysis = analyzer.analyze_query(query)
-            confidence = analysis.get("confidence", 0)
-            query_type = analysis.get("query_type", "general")
-            logger.info(f"Query: '{query}' -> Type: {query_type}, Confidence: {confidence:.2f}")
+        # Batch the per-query results into one log record per section instead
+        # of one logging call per iteration
+        def summarize(queries):
+            lines = []
+            for query in queries:
+                analysis = analyzer.analyze_query(query)
+                confidence = analysis.get("confidence", 0)
+                query_type = analysis.get("query_type", "general")
+                lines.append(
+                    f"Query: '{query}' -> Type: {query_type}, Confidence: {confidence:.2f}"
+                )
+            return "\n".join(lines)
+
+        logger.info(
+            "\n--- Testing Non-Triggering Queries (should be low confidence) ---\n%s",
+            summarize(non_triggering_queries),
+        )
+        logger.info(
+            "\n--- Testing Triggering Queries (should be high confidence) ---\n%s",
+            summarize(triggering_queries),
+        )
         
         logger.info("✅ ExaSearch sensitivity test completed successfully")
         return True
@@ -94,29 +96,32 @@ def test_exasearch_config():
 def test_pollinations_search_keywords():
     """Test that pollinations model has reduced search keywords"""
     try:
-        # Import the pollinations model
-        from aimodels.pollinations.infer import Completions
-        
-        # Create a mock instance to test the search keywords
-        # We'll check the class-level keywords by inspecting the source
-        import inspect
-        
-        # Get the source code of the fallback detection method
-        source = inspect.getsource(Completions._fallback_detect_tool_needs)
-        
+        # Import the module-level keyword list directly instead of scanning
+        # the method source with inspect
+        from aimodels.pollinations.infer import WEB_SEARCH_KEYWORDS
+
         # Check for the reduced keyword list
-        if "latest news" in source and "breaking news" in source:
+        if (
+            "latest news" in WEB_SEARCH_KEYWORDS
+            and "breaking news" in WEB_SEARCH_KEYWORDS
+        ):
             logger.info("✅ Pollinations search keywords have been reduced")
-            
+
             # Count occurrences of common words that were removed
             reduced_words = ["latest", "news", "current", "recent", "search"]
-            found_words = [word for word in reduced_words if word in source]
-            
+            # Substring scan across the keyword phrases, matching the old
+            # check against the method source
+            found_words = [
+                word
+                for word in reduced_words
+                if any(word in keyword for keyword in WEB_SEARCH_KEYWORDS)
+            ]
+
             if len(found_words) < len(reduced_words):
                 logger.info(f"✅ Some common trigger words removed: {found_words}")
             else:
                 logger.warning("⚠️  Some common trigger words may still be present")
-                
+
             return True
         else:
             logger.error("❌ Could not find updated search keywords in pollinations model")
@@ -5,14 +5,8 @@ Tests all the new capabilities including vision, audio, and function calling
 """
 
 import sys
-import os
 import asyncio
 import logging
-from pathlib import Path
-
-# Add the project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -40,28 +34,20 @@ def test_pollinations_ai_features():
         available_models = pollinations.get_available_models()
         logger.info(f"Available models: {available_models}")
         
-        # Test vision capabilities method existence
-        if hasattr(pollinations, 'analyze_image'):
-            logger.info("✅ Vision capabilities method exists")
-        else:
-            logger.error("❌ Vision capabilities method missing")
-            
-        # Test audio capabilities method existence
-        if hasattr(pollinations, 'transcribe_audio'):
-            logger.info("✅ Speech-to-text capabilities method exists")
-        else:
-            logger.error("❌ Speech-to-text capabilities method missing")
-            
-        if hasattr(pollinations, 'generate_speech'):
-            logger.info("✅ Text-to-speech capabilities method exists")
-        else:
-            logger.error("❌ Text-to-speech capabilities method missing")
-            
-        # Test function calling method existence
-        if hasattr(pollinations, 'call_function'):
-            logger.info("✅ Function calling capabilities method exists")
-        else:
-            logger.error("❌ Function calling capabilities method missing")
+        # Check all capability methods with a single dir() diff instead of a
+        # hasattr chain
+        capability_methods = {
+            'analyze_image': "Vision",
+            'transcribe_audio': "Speech-to-text",
+            'generate_speech': "Text-to-speech",
+            'call_function': "Function calling",
+        }
+        missing_methods = set(capability_methods) - set(dir(pollinations))
+        for method, capability in capability_methods.items():
+            if method in missing_methods:
+                logger.error(f"❌ {capability} capabilities method missing")
+            else:
+                logger.info(f"✅ {capability} capabilities method exists")
             
         # Test enhanced image generation
         logger.info("Testing enhanced image generation parameters...")
@@ -1,10 +1,63 @@
 from __future__ import annotations
 from .manifest import ToolManifest
+from cachetools import TTLCache
 import aiohttp
-import discord
 import logging
+import re
+import time
 from os import environ
 
+# CoinMarketCap numeric IDs are plain ASCII digit strings; [0-9] (not \d,
+# which matches unicode digits) rejects inputs str.isdigit() would accept
+_CMC_ID_RE = re.compile(r"[0-9]+")
+
+# Shared timeout object; built once instead of per request
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Short-lived in-process cache of parsed quote data, shared across Tool
+# instances (a new Tool is created per invocation). Keyed by "id:<n>" or
+# "sym:<SYMBOL>"; TTLCache expires and evicts entries so user-supplied
+# tokens can't grow the cache without bound.
+_QUOTE_CACHE_TTL = 60  # seconds
+_quote_cache = TTLCache(maxsize=256, ttl=_QUOTE_CACHE_TTL)
+
+# Unknown symbols/ids rarely become valid quickly; remember misses so repeat
+# asks for the same bogus token skip the HTTP round-trip entirely. Bounded:
+# the keys are arbitrary invalid user input, so a plain dict would let any
+# user grow it indefinitely with made-up symbols.
+_NEGATIVE_CACHE_TTL = 300  # seconds
+_negative_cache = TTLCache(maxsize=512, ttl=_NEGATIVE_CACHE_TTL)
+
+# Daily-refreshed symbol -> CoinMarketCap id map so symbol lookups hit the
+# unambiguous id path of the quotes endpoint
+_SYMBOL_MAP_TTL = 86400  # seconds
+_symbol_map = {}
+_symbol_map_loaded_at = 0.0
+
+# Prebuilt templates for the optional market-data lines appended after the
+# price: (quote key, template for values >= 1, template for smaller values)
+_MARKET_DATA_LINES = (
+    ("market_cap", "📊 Market Cap: ${:,.0f}", "📊 Market Cap: ${:.6f}"),
+    ("volume_24h", "📈 24h Volume: ${:,.0f}", "📈 24h Volume: ${:.2f}"),
+)
+
+# Percent-change lines: (quote key, label)
+_CHANGE_LINES = (
+    ("percent_change_1h", "1h Change"),
+    ("percent_change_24h", "24h Change"),
+    ("percent_change_7d", "7d Change"),
+)
+
+# Use orjson for faster JSON decoding when available
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
 
 class Tool(ToolManifest):
     """Tool to fetch live price for any cryptocurrency using CoinMarketCap API.
@@ -27,6 +80,18 @@ class Tool(ToolManifest):
         self.discord_ctx = discord_ctx
         self.discord_bot = discord_bot
 
+        # Build the static CoinMarketCap request headers once per Tool
+        # instance instead of on every price lookup
+        api_key = environ.get("COINMARKETCAP_API_KEY")
+        self._cmc_headers = (
+            {
+                "Accepts": "application/json",
+                "X-CMC_PRO_API_KEY": api_key,
+            }
+            if api_key
+            else None
+        )
+
         # Priority mapping for common symbols to avoid confusion with meme tokens
         self.symbol_priority = {
             "SOL": ["Solana", "SOL"],  # Prioritize actual Solana over meme tokens
@@ -62,15 +127,62 @@ class Tool(ToolManifest):
         # If no priority match found, return the first one (original behavior)
         return crypto_list[0]
 
+    async def _resolve_symbol_id(self, session: aiohttp.ClientSession, symbol: str):
+        """Resolve a symbol to its CoinMarketCap id via a daily-refreshed map.
+
+        Returns the id as a string, or None when the symbol is unknown or the
+        map could not be refreshed (the caller falls back to symbol lookup).
+        """
+        global _symbol_map_loaded_at
+
+        now = time.monotonic()
+        if not _symbol_map or now - _symbol_map_loaded_at >= _SYMBOL_MAP_TTL:
+            try:
+                async with session.get(
+                    self.CMC_ID_MAP,
+                    params={"listing_status": "active"},
+                    headers=self._cmc_headers,
+                    timeout=_REQUEST_TIMEOUT,
+                ) as resp:
+                    resp.raise_for_status()
+                    data = await resp.json(loads=_json_loads)
+
+                new_map = {}
+                # Symbols with a priority mapping go through the same name
+                # matching as quote responses, so the map can't hand back a
+                # same-symbol meme token instead of the canonical coin
+                priority_candidates = {}
+                for entry in data.get("data", []):
+                    entry_symbol = entry.get("symbol")
+                    if not entry_symbol:
+                        continue
+                    if entry_symbol in self.symbol_priority:
+                        priority_candidates.setdefault(entry_symbol, []).append(entry)
+                    elif entry_symbol not in new_map:
+                        # First entry per symbol for everything else
+                        new_map[entry_symbol] = str(entry["id"])
+                for entry_symbol, candidates in priority_candidates.items():
+                    chosen = self._prioritize_crypto_matches(candidates, entry_symbol)
+                    if chosen:
+                        new_map[entry_symbol] = str(chosen["id"])
+
+                if new_map:
+                    _symbol_map.clear()
+                    _symbol_map.update(new_map)
+                    _symbol_map_loaded_at = now
+            except Exception as e:
+                logging.warning(f"Failed to refresh CoinMarketCap symbol map: {e}")
+
+        return _symbol_map.get(symbol)
+
     async def _tool_function_get_token_price(self, token: str):
         """Fetch the current price of a cryptocurrency token."""
         token = token.strip()
         if not token:
             raise ValueError("token parameter cannot be empty")
 
-        # Get API key from environment
-        api_key = environ.get("COINMARKETCAP_API_KEY")
-        if not api_key:
+        # API key is resolved once in __init__
+        if not self._cmc_headers:
             error_msg = "❌ COINMARKETCAP_API_KEY not set in environment variables. Please configure your API key in dev.env"
             await self.method_send(error_msg)
             raise Exception("COINMARKETCAP_API_KEY not set in environment variables")
@@ -86,7 +198,15 @@ class Tool(ToolManifest):
         session: aiohttp.ClientSession = self.discord_bot._aiohttp_main_client_session
 
         # Determine if token is a symbol or ID
-        is_numeric = token.isdigit()
+        is_numeric = _CMC_ID_RE.fullmatch(token) is not None
+
+        # Pre-resolve known symbols to their CoinMarketCap id so the quotes
+        # request takes the unambiguous id path
+        if not is_numeric:
+            mapped_id = await self._resolve_symbol_id(session, token.upper())
+            if mapped_id:
+                token = mapped_id
+                is_numeric = True
 
         # Prepare API request parameters
         params = {}
@@ -95,61 +215,64 @@ class Tool(ToolManifest):
         else:
             params["symbol"] = token.upper()
 
-        headers = {
-            "Accepts": "application/json",
-            "X-CMC_PRO_API_KEY": api_key,
-        }
+        # Serve recently fetched quotes from the in-process cache
+        cache_key = f"id:{token}" if is_numeric else f"sym:{token.upper()}"
 
-        try:
-            # Fetch price data from CoinMarketCap
-            async with session.get(
-                self.CMC_QUOTES_LATEST, params=params, headers=headers, timeout=10
-            ) as resp:
-                resp.raise_for_status()
-                data = await resp.json()
-
-            # Parse response
-            if "data" not in data:
-                error_msg = "❌ Invalid response from CoinMarketCap API. Please try again later."
+        # Short-circuit tokens that recently came back unknown
+        if cache_key in _negative_cache:
+            if is_numeric:
+                error_msg = f"❌ Cryptocurrency with ID {token} not found. Please check the ID and try again."
                 await self.method_send(error_msg)
-                raise Exception("Invalid response from CoinMarketCap API")
+                raise Exception(f"Cryptocurrency with ID {token} not found")
+            error_msg = f"❌ Cryptocurrency {token.upper()} not found. Please check the symbol and try again."
+            await self.method_send(error_msg)
+            raise Exception(f"Cryptocurrency {token.upper()} not found")
 
-            # Handle symbol vs ID response structure
-            crypto_data = None
-            if is_numeric:
-                if token in data["data"]:
-                    crypto_data = data["data"][token]
-                else:
-                    error_msg = f"❌ Cryptocurrency with ID {token} not found. Please check the ID and try again."
+        crypto_data = _quote_cache.get(cache_key)
+
+        try:
+            if crypto_data is None:
+                # Fetch price data from CoinMarketCap
+                async with session.get(
+                    self.CMC_QUOTES_LATEST,
+                    params=params,
+                    headers=self._cmc_headers,
+                    timeout=_REQUEST_TIMEOUT,
+                ) as resp:
+                    resp.raise_for_status()
+                    data = await resp.json(loads=_json_loads)
+
+                # Parse response
+                if "data" not in data:
+                    error_msg = "❌ Invalid response from CoinMarketCap API. Please try again later."
                     await self.method_send(error_msg)
-                    raise Exception(f"Cryptocurrency with ID {token} not found")
-            else:
-                token_upper = token.upper()
-                if token_upper in data["data"]:
-                    # Handle case where multiple coins might have the same symbol
-                    crypto_list = data["data"][token_upper]
-                    if isinstance(crypto_list, list) and len(crypto_list) > 0:
-                        # Prioritize well-known cryptocurrencies to avoid meme token confusion
-                        crypto_data = self._prioritize_crypto_matches(
-                            crypto_list, token_upper
-                        )
-                    elif isinstance(crypto_list, dict):
-                        crypto_data = crypto_list
-                    else:
-                        error_msg = f"❌ Cryptocurrency {token_upper} not found. Please check the symbol and try again."
+                    raise Exception("Invalid response from CoinMarketCap API")
+
+                # Both id and symbol lookups reduce to a single entry under
+                # data["data"]; symbol entries may be a list when multiple
+                # coins share the symbol
+                lookup_key = token if is_numeric else token.upper()
+                entry = data["data"].get(lookup_key)
+                if isinstance(entry, list):
+                    # Prioritize well-known cryptocurrencies to avoid meme token confusion
+                    entry = (
+                        self._prioritize_crypto_matches(entry, lookup_key)
+                        if entry
+                        else None
+                    )
+
+                if not entry:
+                    _negative_cache[cache_key] = True
+                    if is_numeric:
+                        error_msg = f"❌ Cryptocurrency with ID {token} not found. Please check the ID and try again."
                         await self.method_send(error_msg)
-                        raise Exception(f"Cryptocurrency {token_upper} not found")
-                else:
-                    error_msg = f"❌ Cryptocurrency {token_upper} not found. Please check the symbol and try again."
+                        raise Exception(f"Cryptocurrency with ID {token} not found")
+                    error_msg = f"❌ Cryptocurrency {lookup_key} not found. Please check the symbol and try again."
                     await self.method_send(error_msg)
-                    raise Exception(f"Cryptocurrency {token_upper} not found")
+                    raise Exception(f"Cryptocurrency {lookup_key} not found")
 
-            if not crypto_data:
-                error_msg = (
-                    f"❌ Failed to fetch data for {token}. Please try again later."
-                )
-                await self.method_send(error_msg)
-                raise Exception(f"Failed to fetch data for {token}")
+                crypto_data = entry
+                _quote_cache[cache_key] = crypto_data
 
             # Extract price and market data
             symbol = crypto_data.get("symbol", token.upper())
@@ -168,42 +291,28 @@ class Tool(ToolManifest):
                 await self.method_send(error_msg)
                 raise Exception("Price data not available")
 
-            # Get additional market data
-            market_cap = quote.get("market_cap")
-            volume_24h = quote.get("volume_24h")
-            percent_change_1h = quote.get("percent_change_1h")
-            percent_change_24h = quote.get("percent_change_24h")
-            percent_change_7d = quote.get("percent_change_7d")
-
             # Format the response message
             price_formatted = f"${price:,.6f}" if price < 1 else f"${price:,.2f}"
 
-            message = f"💰 Current {name} ({symbol}) price: **{price_formatted} USD** (via CoinMarketCap)"
-
-            # Add additional market data if available
-            if market_cap is not None:
-                market_cap_formatted = (
-                    f"${market_cap:,.0f}" if market_cap >= 1 else f"${market_cap:.6f}"
-                )
-                message += f"\n📊 Market Cap: {market_cap_formatted}"
-
-            if volume_24h is not None:
-                volume_formatted = (
-                    f"${volume_24h:,.0f}" if volume_24h >= 1 else f"${volume_24h:.2f}"
-                )
-                message += f"\n📈 24h Volume: {volume_formatted}"
-
-            if percent_change_1h is not None:
-                emoji = "🟢" if percent_change_1h >= 0 else "🔴"
-                message += f"\n{emoji} 1h Change: {percent_change_1h:+.2f}%"
-
-            if percent_change_24h is not None:
-                emoji = "🟢" if percent_change_24h >= 0 else "🔴"
-                message += f"\n{emoji} 24h Change: {percent_change_24h:+.2f}%"
-
-            if percent_change_7d is not None:
-                emoji = "🟢" if percent_change_7d >= 0 else "🔴"
-                message += f"\n{emoji} 7d Change: {percent_change_7d:+.2f}%"
+            parts = [
+                f"💰 Current {name} ({symbol}) price: **{price_formatted} USD** (via CoinMarketCap)"
+            ]
+
+            # Add additional market data if available, using the prebuilt templates
+            for key, fmt_large, fmt_small in _MARKET_DATA_LINES:
+                value = quote.get(key)
+                if value is not None:
+                    parts.append(
+                        (fmt_large if value >= 1 else fmt_small).format(value)
+                    )
+
+            for key, label in _CHANGE_LINES:
+                value = quote.get(key)
+                if value is not None:
+                    emoji = "🟢" if value >= 0 else "🔴"
+                    parts.append(f"{emoji} {label}: {value:+.2f}%")
+
+            message = "\n".join(parts)
 
             await self.method_send(message)
             return {"symbol": symbol, "name": name, "price_usd": price, "quote": quote}
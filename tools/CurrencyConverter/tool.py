@@ -1,9 +1,57 @@
 from __future__ import annotations
 from .manifest import ToolManifest
+from core.services.reliability import (
+    RETRYABLE_STATUSES,
+    CircuitOpenError,
+    TransientHTTPError,
+    get_circuit_breaker,
+    retry_with_backoff,
+)
 import aiohttp
+import asyncio
 import discord
 import logging
 import json
+import re
+import time
+
+# Use orjson for faster JSON decoding when available
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# In-process cache of full per-base rates tables, shared across Tool
+# instances (a new Tool is created per invocation). One fetch serves every
+# target currency for that base until the entry expires. The free tier
+# refreshes rates roughly daily, so each entry's TTL comes from the API's
+# own next-update timestamp when present; this is just the fallback.
+_RATES_CACHE_TTL = 3600  # seconds
+_rates_cache = {}  # base currency -> (monotonic timestamp, ttl, rates dict)
+
+# End-to-end time budget for one rates fetch, shared across retries so the
+# user-visible latency stays bounded even when the upstream hangs mid-body
+_CALL_DEADLINE_BUDGET = 25.0  # seconds
+
+# Per-attempt request timeout; individual attempts are further clamped to
+# whatever remains of the call deadline
+_REQUEST_TIMEOUT = 10.0  # seconds
+
+# Currencies conventionally displayed without decimal places
+_ZERO_DECIMAL = frozenset({"JPY", "KRW", "ARS"})
+
+# ISO-4217 codes are exactly three ASCII letters; rejecting malformed input
+# locally avoids burning an API call (and free-tier quota) on user typos
+_CURRENCY_CODE_RE = re.compile(r"[A-Z]{3}")
+
+# Prebuilt conversion message template, rendered with one str.format call
+_MSG_TMPL = (
+    "💱 **Currency Conversion**\n"
+    "**{fi} {fc}** ({fn}) = **{fa} {tc}** ({tn})\n"
+    "💹 Exchange Rate: 1 {fc} = {er:.6f} {tc}"
+)
 
 
 class Tool(ToolManifest):
@@ -42,50 +90,144 @@ class Tool(ToolManifest):
         "PLN": "Polish Zloty",
     }
 
+    # Bulkhead bounding concurrent rate fetches across all instances of this
+    # tool so a burst of conversions can't exhaust the shared connection pool.
+    # Created lazily so the semaphore binds the running event loop.
+    _bulkhead = None
+
+    @classmethod
+    def _get_bulkhead(cls) -> asyncio.Semaphore:
+        if cls._bulkhead is None:
+            cls._bulkhead = asyncio.Semaphore(20)
+        return cls._bulkhead
+
     def __init__(self, method_send, discord_ctx, discord_bot):
         super().__init__()
         self.method_send = method_send
         self.discord_ctx = discord_ctx
         self.discord_bot = discord_bot
 
-    async def _fetch_exchange_rate(self, from_currency: str, to_currency: str) -> float:
-        """Fetch the current exchange rate between two currencies."""
-        if not hasattr(self.discord_bot, "_aiohttp_main_client_session"):
+        # Resolve the shared session once instead of a hasattr lookup on
+        # every fetch; None is diagnosed at call time with the usual error
+        self._session = getattr(discord_bot, "_aiohttp_main_client_session", None)
+
+        # Age in minutes of the rates served, set when the API was down and
+        # an expired cache entry was used instead of failing outright
+        self._stale_rates_age = None
+
+    async def _fetch_rates_table(self, base_currency: str) -> dict:
+        """Fetch the full rates table for a base currency, serving from cache.
+
+        One API response contains the rate for every target currency of a
+        given base, so back-to-back conversions sharing a base collapse into
+        a single HTTP fetch. When the API is unreachable and an expired table
+        exists, it is served anyway (with `_stale_rates_age` set) so the bot
+        degrades gracefully during outages.
+        """
+        # Serve from the cached rates table when it is still fresh
+        cached = _rates_cache.get(base_currency)
+        if cached and time.monotonic() - cached[0] < cached[1]:
+            return cached[2]
+
+        try:
+            return await self._fetch_rates_table_fresh(base_currency)
+        except Exception as e:
+            if cached:
+                self._stale_rates_age = (time.monotonic() - cached[0]) / 60
+                logging.warning(
+                    f"Exchange-rate fetch failed ({e}); serving stale {base_currency} "
+                    f"rates from {self._stale_rates_age:.0f} minutes ago"
+                )
+                return cached[2]
+            raise
+
+    async def _fetch_rates_table_fresh(self, base_currency: str) -> dict:
+        """Fetch a fresh rates table for a base currency from the API."""
+        session: aiohttp.ClientSession = self._session
+        if session is None:
             raise Exception(
                 "aiohttp client session is not initialized; cannot perform HTTP requests."
             )
 
-        session: aiohttp.ClientSession = self.discord_bot._aiohttp_main_client_session
+        # Fail fast while the exchange-rate host is known to be down
+        breaker = get_circuit_breaker("open.er-api.com")
+        if not breaker.allow():
+            raise CircuitOpenError(
+                "Exchange-rate service is temporarily unavailable; please try again shortly"
+            )
 
-        # Normalize currency codes
-        from_currency = from_currency.upper().strip()
-        to_currency = to_currency.upper().strip()
+        # Use the free ExchangeRate-API, retrying transient failures. Every
+        # attempt shares one end-to-end deadline.
+        url = f"{self.EXCHANGE_RATE_API_BASE}/{base_currency}"
+        deadline = time.monotonic() + _CALL_DEADLINE_BUDGET
 
+        async def _request_rates():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise Exception(
+                    "Call deadline exceeded before the request could be issued"
+                )
+            timeout = aiohttp.ClientTimeout(total=min(_REQUEST_TIMEOUT, remaining))
+            async with session.get(url, timeout=timeout) as resp:
+                if resp.status in RETRYABLE_STATUSES:
+                    raise TransientHTTPError(resp.status, resp.reason)
+                resp.raise_for_status()
+                return await resp.json(loads=_json_loads)
+
+        try:
+            async with self._get_bulkhead():
+                data = await retry_with_backoff(
+                    _request_rates, description="ExchangeRate-API request"
+                )
+        except (
+            aiohttp.ClientError,
+            asyncio.TimeoutError,
+            TransientHTTPError,
+        ):
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+
+        if data.get("result") == "success":
+            rates = data.get("rates", {})
+
+            # Cache until shortly before the API's advertised next refresh;
+            # re-fetching sooner can't return different rates anyway
+            ttl = _RATES_CACHE_TTL
+            next_update = data.get("time_next_update_unix")
+            if next_update:
+                until_update = next_update - time.time() - 60
+                if until_update > 0:
+                    ttl = until_update
+
+            _rates_cache[base_currency] = (time.monotonic(), ttl, rates)
+            return rates
+
+        raise Exception(f"API error: {data.get('error-type', 'Unknown error')}")
+
+    async def _fetch_exchange_rate(self, from_currency: str, to_currency: str) -> float:
+        """Fetch the current exchange rate between two currencies.
+
+        Expects already-normalized (uppercase, stripped) currency codes;
+        normalization happens once in `_tool_function_convert_currency`.
+        """
         # If same currency, return 1.0
         if from_currency == to_currency:
             return 1.0
 
         try:
-            # Use the free ExchangeRate-API
-            url = f"{self.EXCHANGE_RATE_API_BASE}/{from_currency}"
+            rates = await self._fetch_rates_table(from_currency)
 
-            async with session.get(url, timeout=10) as resp:
-                resp.raise_for_status()
-                data = await resp.json()
-
-                if data.get("result") == "success":
-                    rates = data.get("rates", {})
-                    if to_currency in rates:
-                        return rates[to_currency]
-                    else:
-                        raise Exception(
-                            f"Currency {to_currency} not found in exchange rates"
-                        )
-                else:
-                    raise Exception(
-                        f"API error: {data.get('error-type', 'Unknown error')}"
-                    )
+            if to_currency in rates:
+                return rates[to_currency]
+            else:
+                raise Exception(
+                    f"Currency {to_currency} not found in exchange rates"
+                )
 
+        except CircuitOpenError as e:
+            logging.warning(f"Exchange-rate circuit open, failing fast: {e}")
+            raise
         except aiohttp.ClientError as e:
             logging.error(f"Failed to fetch exchange rate: {e}")
             raise Exception(f"Failed to fetch exchange rate: {e}")
@@ -112,6 +254,12 @@ class Tool(ToolManifest):
             from_currency = from_currency.upper().strip()
             to_currency = to_currency.upper().strip()
 
+            # Reject malformed codes before spending an API call on them
+            if not _CURRENCY_CODE_RE.fullmatch(from_currency):
+                raise ValueError(f"Invalid currency code: {from_currency}")
+            if not _CURRENCY_CODE_RE.fullmatch(to_currency):
+                raise ValueError(f"Invalid currency code: {to_currency}")
+
             # Get exchange rate
             exchange_rate = await self._fetch_exchange_rate(from_currency, to_currency)
 
@@ -125,23 +273,32 @@ class Tool(ToolManifest):
             to_currency_name = self.COMMON_CURRENCIES.get(to_currency, to_currency)
 
             # Format numbers based on currency (some currencies don't use decimals)
-            if to_currency in ["JPY", "KRW", "ARS"]:
-                formatted_amount = f"{converted_amount:,.0f}"
-            else:
-                formatted_amount = f"{converted_amount:,.2f}"
-
-            if from_currency in ["JPY", "KRW", "ARS"]:
-                formatted_input = f"{amount:,.0f}"
-            else:
-                formatted_input = f"{amount:,.2f}"
+            formatted_amount = (
+                f"{converted_amount:,.0f}"
+                if to_currency in _ZERO_DECIMAL
+                else f"{converted_amount:,.2f}"
+            )
+            formatted_input = (
+                f"{amount:,.0f}" if from_currency in _ZERO_DECIMAL else f"{amount:,.2f}"
+            )
 
-            message = (
-                f"💱 **Currency Conversion**\n"
-                f"**{formatted_input} {from_currency}** ({from_currency_name}) = "
-                f"**{formatted_amount} {to_currency}** ({to_currency_name})\n"
-                f"💹 Exchange Rate: 1 {from_currency} = {exchange_rate:.6f} {to_currency}"
+            message = _MSG_TMPL.format(
+                fi=formatted_input,
+                fc=from_currency,
+                fn=from_currency_name,
+                fa=formatted_amount,
+                tc=to_currency,
+                tn=to_currency_name,
+                er=exchange_rate,
             )
 
+            # Flag degraded-mode conversions that used an expired rates table
+            if self._stale_rates_age is not None:
+                message += (
+                    f"\n⚠️ Live rates are unavailable; using cached rates from "
+                    f"about {self._stale_rates_age:.0f} minutes ago"
+                )
+
             await self.method_send(message)
 
             return {
@@ -1,4 +1,8 @@
 class ToolManifest:
+    # Slots (continued in Tool) drop the per-instance __dict__; a fresh Tool
+    # is built for every invocation so the savings add up
+    __slots__ = ("tool_schema", "tool_schema_openai")
+
     tool_human_name = "Web Search"
     web_search_tool_description = (
         "Search the web to inform response, use semantic or keyword based search."
@@ -56,7 +60,34 @@ class ToolManifest:
                     },
                     "required": ["query"],
                 },
-            }
+            },
+            {
+                "name": "web_search_many",
+                "description": "Run several independent web searches concurrently and get all their results at once. Use this instead of multiple web_search calls when a request needs separate queries (e.g. comparing topics); the searches overlap so the total wait stays close to a single search.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "queries": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "The list of search queries to run concurrently",
+                        },
+                        "numResults": {
+                            "type": "integer",
+                            "description": "The number of results to fetch per query, it's recommended to set from 1-3 for simple queries and more for complex ones",
+                        },
+                        "showHighlights": {
+                            "type": "boolean",
+                            "description": "Show highlights in the search results for every query",
+                        },
+                        "showSummary": {
+                            "type": "boolean",
+                            "description": "Show summary in the search results for every query",
+                        },
+                    },
+                    "required": ["queries"],
+                },
+            },
         ]
 
         # Updated OpenAI schema to match the original tool schema's parameters and types
@@ -1,23 +1,72 @@
 # Built in Tools
 from .manifest import ToolManifest
+from core.services.reliability import (
+    RETRYABLE_STATUSES,
+    CircuitOpenError,
+    TransientHTTPError,
+    get_circuit_breaker,
+    retry_with_backoff,
+)
+from cachetools import TTLCache
+from collections import defaultdict
 from os import environ
+from urllib.parse import urlsplit
 import aiohttp
+import asyncio
 import discord
+import heapq
 import logging
 import re
 from datetime import datetime, timezone
 import hashlib
 from functools import lru_cache
+from operator import itemgetter
 import time
 from typing import Dict, List, Tuple, Optional
 import json
 import yaml
 import os
 
-
+# Use orjson for faster JSON decoding when available; Exa payloads scale
+# with numResults * (summaries + highlights) and can reach tens of KB
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Optional enhanced-AI post-processing, resolved once at import; the search
+# path previously re-ran the import statement (sys.modules lookup and all)
+# on every call
+try:
+    from aimodels.enhanced_web_search import create_enhanced_web_search_handler
+except ImportError:
+    create_enhanced_web_search_handler = None
+
+
+# Patterns stripped from raw queries, compiled once at import instead of
+# re-resolving them through re's internal cache on every call
+_RE_REPLY_META = re.compile(r"<reply_metadata>.*?</reply_metadata>", re.DOTALL)
+_RE_EXTRA_META = re.compile(r"<extra_metadata>.*?</extra_metadata>", re.DOTALL)
+_RE_MSG_CTX = re.compile(
+    r"<\|begin_msg_contexts\|diff>.*?<\|end_msg_contexts\|diff>", re.DOTALL
+)
+_RE_CONSTRAINTS = re.compile(r"<constraints>.*?</constraints>", re.DOTALL)
+_RE_XML_TAG = re.compile(r"<[^>]+>")
+_RE_NEWLINES = re.compile(r"\n+")
+_RE_WS = re.compile(r"\s+")
+
+# Markdown links [text](url), flattened to plain text in enhanced-AI replies
+_MD_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+
+
+@lru_cache(maxsize=512)
 def extract_clean_query(query: str) -> str:
     """
     Extract a clean search query by removing metadata tags and formatting.
+    Pure string-to-string, so repeated queries skip the regex passes
+    entirely via the memo.
 
     Args:
         query: The raw query string that may contain metadata tags
@@ -29,26 +78,21 @@ def extract_clean_query(query: str) -> str:
         return "latest information"
 
     # Remove reply_metadata tags and their content
-    query = re.sub(r"<reply_metadata>.*?</reply_metadata>", "", query, flags=re.DOTALL)
+    query = _RE_REPLY_META.sub("", query)
 
     # Remove extra_metadata tags and their content
-    query = re.sub(r"<extra_metadata>.*?</extra_metadata>", "", query, flags=re.DOTALL)
+    query = _RE_EXTRA_META.sub("", query)
 
     # Remove other common metadata tags
-    query = re.sub(
-        r"<\|begin_msg_contexts\|diff>.*?<\|end_msg_contexts\|diff>",
-        "",
-        query,
-        flags=re.DOTALL,
-    )
-    query = re.sub(r"<constraints>.*?</constraints>", "", query, flags=re.DOTALL)
+    query = _RE_MSG_CTX.sub("", query)
+    query = _RE_CONSTRAINTS.sub("", query)
 
     # Remove any remaining XML-like tags
-    query = re.sub(r"<[^>]+>", "", query)
+    query = _RE_XML_TAG.sub("", query)
 
     # Clean up whitespace and newlines
-    query = re.sub(r"\n+", " ", query)
-    query = re.sub(r"\s+", " ", query)
+    query = _RE_NEWLINES.sub(" ", query)
+    query = _RE_WS.sub(" ", query)
 
     # Remove leading/trailing whitespace
     query = query.strip()
@@ -60,24 +104,104 @@ def extract_clean_query(query: str) -> str:
     return query
 
 
+# End-to-end time budget for one search call, shared across retries so the
+# user-visible latency stays bounded even when the upstream hangs mid-body
+_SEARCH_DEADLINE_BUDGET = 30.0  # seconds
+
+# Fields projected from each raw Exa result into the tool output
+_RESULT_FIELDS = ("title", "url", "summary", "highlights", "publishedDate")
+
+# Static guidance fields of the tool output, shared across calls and spread
+# into each _output dict instead of rebuilt from literals per request
+_STATIC_OUTPUT_FIELDS = {
+    "guidelines": "You must always provide references and format links with [Page Title](Page URL). As possible, rank the most relevant and fresh sources based on dates.",
+    "formatting_rules": "Do not provide links as [Page URL](Page URL), always provide a title as this [Page Title](Page URL), if it doesn't just directly send the URL",
+    "formatting_reason": "Now the reason for this is Discord doesn't nicely format the links if you don't provide a title",
+    "showLinks": "No need to list all references, only most relevant ones",
+}
+
+# Per-result response fragments, prebuilt so the hot formatting loops render
+# each result with one str.format call instead of several appends
+_ADDL_WITH_SUMMARY = "**{i}. {title}**\n{summary}...\n\n"
+_ADDL_WITH_URL = "**{i}. {title}**\nSource: {url}\n\n"
+_SOURCE_WITH_SUMMARY = "{i}. **{title}**\n   Source: {url}\n   {summary}...\n"
+_SOURCE_PLAIN = "{i}. **{title}**\n   Source: {url}\n"
+
+# Identical queries in flight at the same time (several users asking the
+# same thing during a burst) share one network call instead of each issuing
+# their own. Keyed by query hash; module-level because Tool instances are
+# recreated per invocation.
+_inflight = {}  # query hash -> asyncio.Future resolving to the decoded payload
+
+# Shared search-result cache, created by the first Tool instance with the
+# configured size/TTL. TTLCache expires and evicts in O(1) instead of the
+# old full min-scan over up to max_cache_size entries, and sharing it across
+# Tool instances (recreated per invocation) makes hits actually possible.
+_search_cache = None
+
+# Cache the parsed config for the process lifetime; every Tool instantiation
+# (one per tool invocation) was re-reading and re-parsing the YAML file.
+_exasearch_config_cache = None
+
+# Prefer libyaml's C SafeLoader when PyYAML was built with it; the pure-
+# Python loader is 10-50x slower for the one cold parse at startup
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def load_exasearch_config() -> Dict:
-    """Load ExaSearch configuration from file"""
+    """Load ExaSearch configuration from file (cached after first load)"""
+    global _exasearch_config_cache
+    if _exasearch_config_cache is not None:
+        return _exasearch_config_cache
+
     config_path = "data/exasearch_config.yaml"
 
     try:
         if os.path.exists(config_path):
             with open(config_path, "r") as file:
-                config = yaml.safe_load(file)
+                config = yaml.load(file, Loader=_YAML_LOADER)
                 logging.info("Loaded ExaSearch configuration from file")
-                return config
         else:
             logging.warning(
                 f"ExaSearch config file not found at {config_path}, using defaults"
             )
-            return {}
+            config = {}
     except Exception as e:
         logging.error(f"Error loading ExaSearch config: {e}")
-        return {}
+        config = {}
+
+    _exasearch_config_cache = config
+    return config
+
+
+# Exa request headers, built once per process: only x-api-key varies and it
+# comes from the environment, which is fixed for the bot's lifetime
+_exa_headers = None
+
+
+def _get_exa_headers() -> Dict:
+    """Return the static Exa API headers, reading EXA_API_KEY on first use."""
+    global _exa_headers
+    if _exa_headers is None:
+        api_key = environ.get("EXA_API_KEY")
+        if not api_key:
+            raise ValueError(
+                "EXA_API_KEY key not set. Please set this environment variable to use the web search tool."
+            )
+        _exa_headers = {
+            "accept": "application/json",
+            "content-type": "application/json",
+            "x-api-key": api_key,
+        }
+    return _exa_headers
+
+
+# Memoized query analyses, shared process-wide: analysis is deterministic
+# for a given query because the config behind the patterns is cached for the
+# process lifetime. Entries store a snapshot; hits hand out shallow copies
+# so callers can adjust num_results etc. without corrupting the memo.
+_analysis_cache = {}
+_ANALYSIS_CACHE_MAX = 512
 
 
 class QueryAnalyzer:
@@ -222,24 +346,54 @@ class QueryAnalyzer:
             },
         }
 
+        # Precompile one keyword alternation per query type so each query is
+        # scanned in a single regex pass instead of one substring search per
+        # keyword. Longest keywords first so phrases win over their prefixes.
+        # Keywords are frozen to tuples with their length precomputed, so
+        # analyze_query does no per-call len()/list work on them.
+        for pattern in self.query_patterns.values():
+            keywords = tuple(pattern["keywords"])
+            pattern["keywords"] = keywords
+            pattern["keyword_count"] = len(keywords)
+            if keywords:
+                pattern["keyword_regex"] = re.compile(
+                    "|".join(
+                        re.escape(keyword)
+                        for keyword in sorted(keywords, key=len, reverse=True)
+                    )
+                )
+            else:
+                pattern["keyword_regex"] = None
+
     def analyze_query(self, query: str) -> Dict:
         """Analyze query to determine optimal search parameters"""
+        cached = _analysis_cache.get(query)
+        if cached is not None:
+            return dict(cached)
+
+        # Lowered form and token list are computed once and reused below
         query_lower = query.lower()
+        query_tokens = query_lower.split()
 
-        # Determine query type
+        # Determine query type: score every pattern and keep the strongest
+        # match instead of breaking on the first type to cross its threshold.
+        # First-match-wins depended on dict-insertion order, so a query like
+        # "latest football scores" classified as news and never tried sports.
         query_type = "general"
         confidence = 0.0
 
         for qtype, pattern in self.query_patterns.items():
-            matches = sum(
-                1 for keyword in pattern["keywords"] if keyword in query_lower
-            )
-            if matches > 0:
-                confidence = matches / len(pattern["keywords"])
-                threshold = pattern.get("confidence_threshold", 0.3)
-                if confidence > threshold:  # Use configurable threshold
-                    query_type = qtype
-                    break
+            if pattern["keyword_regex"] is None:
+                continue
+            # Count distinct keywords hit in one scan
+            matches = len(set(pattern["keyword_regex"].findall(query_lower)))
+            if matches == 0:
+                continue
+            pattern_confidence = matches / pattern["keyword_count"]
+            threshold = pattern.get("confidence_threshold", 0.3)
+            if pattern_confidence > threshold and pattern_confidence > confidence:
+                query_type = qtype
+                confidence = pattern_confidence
 
         # Get base parameters for detected type
         base_params = self.query_patterns.get(
@@ -247,13 +401,13 @@ class QueryAnalyzer:
         )
 
         # Adjust based on query complexity
-        word_count = len(query.split())
+        word_count = len(query_tokens)
         if word_count <= 2:
             base_params["num_results"] = min(base_params["num_results"], 3)
         elif word_count >= 8:
             base_params["num_results"] = min(base_params["num_results"] + 2, 10)
 
-        return {
+        analysis = {
             "query_type": query_type,
             "confidence": confidence,
             "word_count": word_count,
@@ -262,6 +416,40 @@ class QueryAnalyzer:
             "enhancements": base_params["enhancements"],
         }
 
+        if len(_analysis_cache) >= _ANALYSIS_CACHE_MAX:
+            _analysis_cache.clear()
+        _analysis_cache[query] = dict(analysis)
+
+        return analysis
+
+
+# Default domain-authority weights; config entries override or extend these
+_DOMAIN_WEIGHT_DEFAULTS = {
+    ".edu": 3.0,
+    ".gov": 3.0,
+    "wikipedia.org": 2.5,
+    ".org": 2.0,
+    ".com": 1.0,
+    ".net": 1.0,
+    ".io": 1.5,
+    "github.com": 2.0,
+    "stackoverflow.com": 2.5,
+    "reddit.com": 1.5,
+    "twitter.com": 1.0,
+    "youtube.com": 1.5,
+    "medium.com": 1.5,
+    "dev.to": 1.5,
+    "hashnode.dev": 1.5,
+}
+
+# Default content-quality thresholds; config entries override per key
+_QUALITY_INDICATOR_DEFAULTS = {
+    "min_title_length": 10,
+    "min_summary_length": 50,
+    "max_title_length": 200,
+    "max_summary_length": 500,
+}
+
 
 class ResultScorer:
     """Advanced result scoring for better relevance ranking"""
@@ -272,35 +460,35 @@ class ResultScorer:
         # Load scoring weights from config
         scoring_weights = self.config.get("scoring_weights", {})
 
-        # Domain authority weights from config or defaults
+        # Domain authority weights: one dict merge instead of fifteen
+        # per-key .get calls, and config can now add sites beyond the
+        # defaults instead of only overriding them
         domain_weights_config = self.config.get("domain_weights", {})
-        self.domain_weights = {
-            ".edu": domain_weights_config.get(".edu", 3.0),
-            ".gov": domain_weights_config.get(".gov", 3.0),
-            "wikipedia.org": domain_weights_config.get("wikipedia.org", 2.5),
-            ".org": domain_weights_config.get(".org", 2.0),
-            ".com": domain_weights_config.get(".com", 1.0),
-            ".net": domain_weights_config.get(".net", 1.0),
-            ".io": domain_weights_config.get(".io", 1.5),
-            "github.com": domain_weights_config.get("github.com", 2.0),
-            "stackoverflow.com": domain_weights_config.get("stackoverflow.com", 2.5),
-            "reddit.com": domain_weights_config.get("reddit.com", 1.5),
-            "twitter.com": domain_weights_config.get("twitter.com", 1.0),
-            "youtube.com": domain_weights_config.get("youtube.com", 1.5),
-            "medium.com": domain_weights_config.get("medium.com", 1.5),
-            "dev.to": domain_weights_config.get("dev.to", 1.5),
-            "hashnode.dev": domain_weights_config.get("hashnode.dev", 1.5),
+        self.domain_weights = {**_DOMAIN_WEIGHT_DEFAULTS, **domain_weights_config}
+
+        # Split the weights into exact hostnames and TLD suffixes so URL
+        # authority is a deterministic two-step dict lookup (host first,
+        # then suffix) instead of an insertion-ordered substring scan where
+        # ".com" could shadow "github.com"
+        self._host_weights = {
+            k: v for k, v in self.domain_weights.items() if not k.startswith(".")
+        }
+        self._tld_weights = {
+            k: v for k, v in self.domain_weights.items() if k.startswith(".")
         }
 
         # Content quality indicators from config
         content_filters = self.config.get("content_filters", {})
         self.quality_indicators = {
-            "min_title_length": content_filters.get("min_title_length", 10),
-            "min_summary_length": content_filters.get("min_summary_length", 50),
-            "max_title_length": content_filters.get("max_title_length", 200),
-            "max_summary_length": content_filters.get("max_summary_length", 500),
+            key: content_filters.get(key, default)
+            for key, default in _QUALITY_INDICATOR_DEFAULTS.items()
         }
 
+        # Penalty flags resolved once; _score_one runs per result and should
+        # not re-walk the config dict each time
+        self._penalize_short_titles = content_filters.get("penalize_short_titles", True)
+        self._penalize_long_titles = content_filters.get("penalize_long_titles", True)
+
         # Scoring weights
         self.title_relevance_weight = scoring_weights.get("title_relevance", 4.0)
         self.summary_quality_weight = scoring_weights.get("summary_quality", 3.0)
@@ -310,23 +498,45 @@ class ResultScorer:
 
     def score_result(self, result: dict, query: str) -> float:
         """Score a search result based on multiple factors"""
-        score = 0.0
         query_lower = query.lower()
+        return self._score_one(
+            result, query_lower, set(query_lower.split()), datetime.now(timezone.utc)
+        )
+
+    def score_results(self, results: list, query: str) -> list:
+        """Score a batch of results in one pass.
+
+        The lowered query, its token set, and the current time are computed
+        once for the whole batch instead of once per result.
+        """
+        query_lower = query.lower()
+        query_words = set(query_lower.split())
+        now = datetime.now(timezone.utc)
+        return [
+            self._score_one(result, query_lower, query_words, now)
+            for result in results
+        ]
+
+    def _score_one(
+        self, result: dict, query_lower: str, query_words: set, now: datetime
+    ) -> float:
+        """Score one result given pre-lowered query context"""
+        score = 0.0
 
         # Title relevance (0-4 points)
-        title = result.get("title", "").lower()
+        raw_title = result.get("title", "")
+        title = raw_title.lower()
         if title:
             # Exact phrase matches
             if query_lower in title:
                 score += self.title_relevance_weight
             # Word overlap
-            query_words = set(query_lower.split())
             title_words = set(title.split())
             overlap = len(query_words.intersection(title_words))
             score += min(overlap * 0.5, self.title_relevance_weight * 0.75)
 
             # Title length quality
-            if len(result["title"]) >= self.quality_indicators["min_title_length"]:
+            if len(raw_title) >= self.quality_indicators["min_title_length"]:
                 score += 1
 
         # Summary quality (0-3 points)
@@ -335,7 +545,8 @@ class ResultScorer:
             if len(summary) >= self.quality_indicators["min_summary_length"]:
                 score += self.summary_quality_weight * 0.67
             # Summary relevance
-            if any(word in summary.lower() for word in query_lower.split()):
+            summary_lower = summary.lower()
+            if any(word in summary_lower for word in query_words):
                 score += self.summary_quality_weight * 0.33
 
         # Date freshness (0-3 points)
@@ -344,7 +555,7 @@ class ResultScorer:
                 pub_date = datetime.fromisoformat(
                     result["publishedDate"].replace("Z", "+00:00")
                 )
-                days_old = (datetime.now(timezone.utc) - pub_date).days
+                days_old = (now - pub_date).days
                 if days_old <= 1:
                     score += self.date_freshness_weight
                 elif days_old <= 7:
@@ -356,31 +567,69 @@ class ResultScorer:
             except:
                 pass
 
-        # Domain authority (0-3 points)
-        url = result.get("url", "").lower()
-        for domain, weight in self.domain_weights.items():
-            if domain in url:
-                score += weight
-                break
+        # Domain authority (0-3 points): exact hostname match wins over the
+        # TLD suffix fallback
+        url = result.get("url", "")
+        if url:
+            try:
+                hostname = urlsplit(url).hostname
+            except ValueError:
+                hostname = None
+            if hostname:
+                hostname = hostname.lower()
+                if hostname.startswith("www."):
+                    hostname = hostname[4:]
+                weight = self._host_weights.get(hostname)
+                if weight is None:
+                    dot = hostname.rfind(".")
+                    if dot != -1:
+                        weight = self._tld_weights.get(hostname[dot:])
+                if weight is not None:
+                    score += weight
 
         # Content type bonus
         if result.get("highlights"):
             score += self.content_bonus_weight
 
-        # Penalize very short or very long content based on config
-        content_filters = self.config.get("content_filters", {})
-        if content_filters.get("penalize_short_titles", True):
-            if len(result.get("title", "")) < 5:
-                score -= 1
-        if content_filters.get("penalize_long_titles", True):
-            if len(result.get("title", "")) > 300:
-                score -= 0.5
+        # Penalize very short or very long titles based on config
+        title_len = len(raw_title)
+        if self._penalize_short_titles and title_len < 5:
+            score -= 1
+        if self._penalize_long_titles and title_len > 300:
+            score -= 0.5
 
         return max(0, score)  # Ensure non-negative score
 
 
 # Function implementations
 class Tool(ToolManifest):
+    __slots__ = (
+        "method_send",
+        "discord_ctx",
+        "discord_bot",
+        "_session",
+        "config",
+        "query_analyzer",
+        "result_scorer",
+        "_cache_ttl",
+        "_max_cache_size",
+        "_enhanced_ai_enabled",
+        "_enhanced_ai_fallback",
+        "_search_cache",
+        "_search_stats",
+    )
+
+    # Bulkhead bounding concurrent Exa requests across all instances of this
+    # tool so a burst of searches can't exhaust the shared connection pool.
+    # Created lazily so the semaphore binds the running event loop.
+    _bulkhead = None
+
+    @classmethod
+    def _get_bulkhead(cls) -> asyncio.Semaphore:
+        if cls._bulkhead is None:
+            cls._bulkhead = asyncio.Semaphore(20)
+        return cls._bulkhead
+
     def __init__(self, method_send, discord_ctx, discord_bot):
         super().__init__()
 
@@ -388,6 +637,10 @@ class Tool(ToolManifest):
         self.discord_ctx = discord_ctx
         self.discord_bot = discord_bot
 
+        # Resolve the shared session once instead of a hasattr lookup on
+        # every search; None is diagnosed at call time with the usual error
+        self._session = getattr(discord_bot, "_aiohttp_main_client_session", None)
+
         # Load configuration
         self.config = load_exasearch_config()
 
@@ -395,9 +648,6 @@ class Tool(ToolManifest):
         self.query_analyzer = QueryAnalyzer(self.config)
         self.result_scorer = ResultScorer(self.config)
 
-        # Initialize cache for repeated searches
-        self._search_cache = {}
-
         # Get cache settings from config
         search_behavior = self.config.get("search_behavior", {})
         self._cache_ttl = search_behavior.get(
@@ -405,12 +655,29 @@ class Tool(ToolManifest):
         )
         self._max_cache_size = search_behavior.get("max_cache_size", 1000)
 
+        # Enhanced-AI flags resolved once; the search path consults these on
+        # every call
+        enhanced_ai_config = self.config.get("enhanced_ai", {})
+        self._enhanced_ai_enabled = bool(enhanced_ai_config.get("enabled", True))
+        self._enhanced_ai_fallback = bool(
+            enhanced_ai_config.get("fallback_to_basic", True)
+        )
+
+        # Attach the shared process-wide cache for repeated searches,
+        # creating it on first use with the configured size and TTL
+        global _search_cache
+        if _search_cache is None:
+            _search_cache = TTLCache(
+                maxsize=self._max_cache_size, ttl=self._cache_ttl
+            )
+        self._search_cache = _search_cache
+
         # Performance tracking
         self._search_stats = {
             "total_searches": 0,
             "cache_hits": 0,
             "average_response_time": 0.0,
-            "query_types": {},
+            "query_types": defaultdict(int),
             "success_rate": 0.0,
         }
 
@@ -423,26 +690,29 @@ class Tool(ToolManifest):
 
         enhanced_query = query
 
+        # Track the lowered form alongside the query so each membership test
+        # below doesn't re-lower the whole (growing) string
+        enhanced_lower = query.lower()
+
         # Add type-specific enhancements
         for enhancement in analysis.get("enhancements", []):
-            if enhancement not in enhanced_query.lower():
+            if enhancement not in enhanced_lower:
                 enhanced_query += f" {enhancement}"
+                enhanced_lower += f" {enhancement.lower()}"
 
         # Add temporal context for news/financial queries
         if query_enhancement.get("add_temporal_context", True):
             if analysis.get("query_type") in ["news", "financial"]:
-                if (
-                    "2025" not in enhanced_query
-                    and "current" not in enhanced_query.lower()
-                ):
+                if "2025" not in enhanced_query and "current" not in enhanced_lower:
                     enhanced_query += " 2025"
+                    enhanced_lower += " 2025"
 
         # Add technical context for programming queries
         if query_enhancement.get("add_technical_context", True):
             if analysis.get("query_type") == "technical":
                 if (
-                    "tutorial" not in enhanced_query.lower()
-                    and "guide" not in enhanced_query.lower()
+                    "tutorial" not in enhanced_lower
+                    and "guide" not in enhanced_lower
                 ):
                     enhanced_query += " tutorial guide"
 
@@ -458,10 +728,18 @@ class Tool(ToolManifest):
         # Limit enhanced query length
         max_length = query_enhancement.get("max_enhanced_length", 200)
         if len(enhanced_query) > max_length:
-            enhanced_query = enhanced_query[:max_length].rsplit(" ", 1)[0]
+            # Cut at the last word boundary before the limit; rfind gives the
+            # index directly without the intermediate list rsplit allocates
+            cut = enhanced_query.rfind(" ", 0, max_length)
+            enhanced_query = (
+                enhanced_query[:cut] if cut > 0 else enhanced_query[:max_length]
+            )
 
         logging.info(
-            f"Enhanced query from '{query}' to '{enhanced_query}' (type: {analysis.get('query_type')})"
+            "Enhanced query from '%s' to '%s' (type: %s)",
+            query,
+            enhanced_query,
+            analysis.get("query_type"),
         )
         return enhanced_query
 
@@ -604,12 +882,15 @@ class Tool(ToolManifest):
         # Add structured insights
         ai_output["key_insights"] = []
         for result in output["results"][:3]:
+            # Reuse the score computed during the search pass; only fallback
+            # paths hand us results that were never scored
+            score = result.get("relevance_score")
+            if score is None:
+                score = self.result_scorer.score_result(result, output.get("query", ""))
             insight = {
                 "topic": result.get("title", ""),
                 "key_points": result.get("highlights", []),
-                "relevance_score": self.result_scorer.score_result(
-                    result, output.get("query", "")
-                ),
+                "relevance_score": score,
             }
             ai_output["key_insights"].append(insight)
 
@@ -625,6 +906,22 @@ class Tool(ToolManifest):
 
         return ai_output
 
+    # Strong references to in-flight tracking tasks; the event loop only
+    # holds weak ones, so unreferenced tasks could be collected mid-run
+    _tracking_tasks = set()
+
+    def _schedule_perf_tracking(self, query: str, start_time: float, analysis: Dict):
+        """Record search metrics off the hot path.
+
+        Tracking is bookkeeping the user never waits on, so it is scheduled
+        as a task instead of awaited before the reply goes out.
+        """
+        task = asyncio.ensure_future(
+            self._track_search_performance(query, start_time, analysis)
+        )
+        self._tracking_tasks.add(task)
+        task.add_done_callback(self._tracking_tasks.discard)
+
     async def _track_search_performance(
         self, query: str, start_time: float, analysis: Dict
     ):
@@ -634,7 +931,9 @@ class Tool(ToolManifest):
         if not performance_config.get("enabled", True):
             return
 
-        duration = time.time() - start_time
+        # start_time comes from time.monotonic(); wall-clock time can jump
+        # backwards under NTP sync and corrupt the rolling average
+        duration = time.monotonic() - start_time
 
         # Update statistics
         self._search_stats["total_searches"] += 1
@@ -647,13 +946,18 @@ class Tool(ToolManifest):
         # Track query types if enabled
         if performance_config.get("track_query_types", True):
             query_type = analysis.get("query_type", "general")
-            self._search_stats["query_types"][query_type] = (
-                self._search_stats["query_types"].get(query_type, 0) + 1
-            )
+            self._search_stats["query_types"][query_type] += 1
 
-        logging.info(
-            f"Search performance - Query: '{query[:50]}...', Type: {analysis.get('query_type', 'general')}, Duration: {duration:.2f}s, Avg: {self._search_stats['average_response_time']:.2f}s"
-        )
+        # The slice + float formatting here is wasted work when INFO is off,
+        # so gate it instead of building the string unconditionally
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info(
+                "Search performance - Query: '%s...', Type: %s, Duration: %.2fs, Avg: %.2fs",
+                query[:50],
+                analysis.get("query_type", "general"),
+                duration,
+                self._search_stats["average_response_time"],
+            )
 
         # Log slow searches
         slow_threshold = performance_config.get("slow_search_threshold", 5.0)
@@ -665,34 +969,22 @@ class Tool(ToolManifest):
         # Sort parameters for consistent hashing
         sorted_params = sorted(params.items())
         query_string = f"{query}:{str(sorted_params)}"
-        return hashlib.md5(query_string.encode()).hexdigest()
+        # blake2b is the fastest stdlib digest and this is only a cache
+        # fingerprint, so 128 bits is plenty
+        return hashlib.blake2b(query_string.encode(), digest_size=16).hexdigest()
 
     def _get_cached_search(self, query_hash: str) -> dict:
         """Get cached search results if available and not expired"""
-        if query_hash in self._search_cache:
-            cache_entry = self._search_cache[query_hash]
-            if time.time() - cache_entry["timestamp"] < self._cache_ttl:
-                self._search_stats["cache_hits"] += 1
-                logging.info(f"Cache hit for query hash: {query_hash}")
-                return cache_entry["data"]
-            else:
-                # Remove expired cache entry
-                del self._search_cache[query_hash]
-        return None
+        data = self._search_cache.get(query_hash)
+        if data is not None:
+            self._search_stats["cache_hits"] += 1
+            logging.info("Cache hit for query hash: %s", query_hash)
+        return data
 
     def _cache_search_results(self, query_hash: str, data: dict):
-        """Cache search results with timestamp"""
-        # Check cache size limit
-        if len(self._search_cache) >= self._max_cache_size:
-            # Remove oldest entry
-            oldest_key = min(
-                self._search_cache.keys(),
-                key=lambda k: self._search_cache[k]["timestamp"],
-            )
-            del self._search_cache[oldest_key]
-
-        self._search_cache[query_hash] = {"data": data, "timestamp": time.time()}
-        logging.info(f"Cached search results for query hash: {query_hash}")
+        """Cache search results; TTLCache handles expiry and eviction"""
+        self._search_cache[query_hash] = data
+        logging.info("Cached search results for query hash: %s", query_hash)
 
     async def _summarize_results(self, results: list, query: str) -> str:
         """Generate a concise summary of search results"""
@@ -724,7 +1016,7 @@ class Tool(ToolManifest):
         showHighlights: bool = False,
         showSummary: bool = False,
     ):
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             # Validate query parameter
@@ -743,7 +1035,7 @@ class Tool(ToolManifest):
             # Log the original and cleaned query for debugging
             if clean_query != query.strip():
                 logging.info(
-                    f"Query cleaned from '{query[:100]}...' to '{clean_query}'"
+                    "Query cleaned from '%s...' to '%s'", query[:100], clean_query
                 )
 
             # Get optimal search parameters based on analysis
@@ -764,38 +1056,26 @@ class Tool(ToolManifest):
             query_hash = self._generate_query_hash(enhanced_query, params)
             cached_result = self._get_cached_search(query_hash)
             if cached_result:
-                await self._track_search_performance(
-                    enhanced_query, start_time, analysis
-                )
+                self._schedule_perf_tracking(enhanced_query, start_time, analysis)
                 return cached_result
 
-            # Check if aiohttp session is available
-            if not hasattr(self.discord_bot, "_aiohttp_main_client_session"):
+            # Check if aiohttp session is available (resolved once in __init__)
+            _session: aiohttp.ClientSession = self._session
+            if _session is None:
                 raise Exception(
                     "aiohttp client session for get requests not initialized and web browsing cannot continue, please check the bot configuration"
                 )
 
-            _session: aiohttp.ClientSession = (
-                self.discord_bot._aiohttp_main_client_session
-            )
-
-            # Check Exa API Key
-            _api_key = environ.get("EXA_API_KEY")
-            if not _api_key:
-                raise ValueError(
-                    "EXA_API_KEY key not set. Please set this environment variable to use the web search tool."
-                )
+            # Check Exa API Key and reuse the per-process header dict
+            _header = _get_exa_headers()
 
             logging.info(
-                f"Starting web search for query: '{enhanced_query}' with type: {params['searchType']} (analysis: {analysis['query_type']})"
+                "Starting web search for query: '%s' with type: %s (analysis: %s)",
+                enhanced_query,
+                params["searchType"],
+                analysis["query_type"],
             )
 
-            _header = {
-                "accept": "application/json",
-                "content-type": "application/json",
-                "x-api-key": _api_key,
-            }
-
             # Construct params with proper validation using enhanced query
             _params = {
                 "query": enhanced_query,
@@ -803,19 +1083,17 @@ class Tool(ToolManifest):
                 "numResults": params["numResults"],
             }
 
-            # Add optional parameters if provided and valid
-            if params.get("includeDomains") and isinstance(
-                params["includeDomains"], list
+            # Add optional list parameters if provided and valid; one lookup
+            # per key instead of a get plus a subscript
+            for _list_param in (
+                "includeDomains",
+                "excludeDomains",
+                "includeText",
+                "excludeText",
             ):
-                _params["includeDomains"] = params["includeDomains"]
-            if params.get("excludeDomains") and isinstance(
-                params["excludeDomains"], list
-            ):
-                _params["excludeDomains"] = params["excludeDomains"]
-            if params.get("includeText") and isinstance(params["includeText"], list):
-                _params["includeText"] = params["includeText"]
-            if params.get("excludeText") and isinstance(params["excludeText"], list):
-                _params["excludeText"] = params["excludeText"]
+                _value = params.get(_list_param)
+                if _value and isinstance(_value, list):
+                    _params[_list_param] = _value
 
             # Add contents if needed
             if params.get("showHighlights") or params.get("showSummary"):
@@ -828,37 +1106,96 @@ class Tool(ToolManifest):
             # Endpoint
             _endpoint = "https://api.exa.ai/search"
 
-            logging.info(f"Making request to Exa API with params: {_params}")
+            logging.info("Making request to Exa API with params: %s", _params)
 
-            # Make a request
-            _data = None
-            try:
+            # Every attempt (including retries) shares one end-to-end
+            # deadline so a hung upstream can't stall the call indefinitely;
+            # the POST previously had no timeout at all
+            _deadline = time.monotonic() + _SEARCH_DEADLINE_BUDGET
+
+            # Make a request, retrying transient upstream failures
+            async def _request_search():
+                _remaining = _deadline - time.monotonic()
+                if _remaining <= 0:
+                    raise Exception(
+                        "Search deadline exceeded before the request could be issued"
+                    )
                 async with _session.post(
-                    _endpoint, headers=_header, json=_params
+                    _endpoint,
+                    headers=_header,
+                    json=_params,
+                    timeout=aiohttp.ClientTimeout(total=_remaining),
                 ) as _response:
                     # Check if the response is successful
                     if _response.status != 200:
-                        _error_text = await _response.text()
+                        # Only the first 512 bytes of the error body are
+                        # worth logging; decoding arbitrarily large bodies
+                        # wastes CPU and can flood the logs
+                        _raw = await _response.content.read(512)
+                        _error_text = _raw.decode("utf-8", errors="replace")
                         logging.error(
                             f"Exa API returned status {_response.status}: {_response.reason}. Response: {_error_text}"
                         )
+                        if _response.status in RETRYABLE_STATUSES:
+                            raise TransientHTTPError(_response.status, _response.reason)
                         raise Exception(
                             f"Exa API returned status code {_response.status}: {_response.reason}"
                         )
 
-                    _data = await _response.json()
+                    return await _response.json(loads=_json_loads)
+
+            # Fail fast while the Exa host is known to be down
+            _breaker = get_circuit_breaker("api.exa.ai")
+            if not _breaker.allow():
+                raise CircuitOpenError(
+                    "Web search is temporarily unavailable; please try again shortly"
+                )
+
+            async def _fetch_search_data():
+                async with self._get_bulkhead():
+                    return await retry_with_backoff(
+                        _request_search, description="Exa API request"
+                    )
+
+            _data = None
+            try:
+                # Coalesce identical in-flight queries onto a single request
+                _pending = _inflight.get(query_hash)
+                if _pending is None:
+                    _pending = asyncio.ensure_future(_fetch_search_data())
+                    _inflight[query_hash] = _pending
+                    try:
+                        _data = await _pending
+                    finally:
+                        _inflight.pop(query_hash, None)
+                else:
                     logging.info(
-                        f"Received response from Exa API with {len(_data.get('results', []))} results"
+                        "Coalescing duplicate in-flight search for query hash: %s",
+                        query_hash,
                     )
+                    # Shield so cancelling this waiter doesn't kill the
+                    # shared request other waiters are blocked on
+                    _data = await asyncio.shield(_pending)
+                _breaker.record_success()
+                logging.info(
+                    "Received response from Exa API with %d results",
+                    len(_data.get("results", [])),
+                )
 
-                    # Check if the data is empty or invalid
-                    if not _data or not _data.get("results"):
-                        raise Exception("No search results found for the query")
+                # Check if the data is empty or invalid
+                if not _data or not _data.get("results"):
+                    raise Exception("No search results found for the query")
 
             except aiohttp.ClientConnectionError as e:
+                _breaker.record_failure()
                 logging.error(f"Connection error to Exa API: {e}")
                 raise Exception(f"Failed to connect to Exa API: {str(e)}")
+            except (asyncio.TimeoutError, TransientHTTPError) as e:
+                _breaker.record_failure()
+                logging.error(f"Exa API request kept failing: {e}")
+                raise Exception(f"Exa API request kept failing: {str(e)}")
             except aiohttp.ClientError as e:
+                _breaker.record_failure()
                 logging.error(f"HTTP request failed: {e}")
                 raise Exception(f"HTTP request failed: {str(e)}")
             except Exception as e:
@@ -871,10 +1208,7 @@ class Tool(ToolManifest):
 
             # Build output
             _output = {
-                "guidelines": "You must always provide references and format links with [Page Title](Page URL). As possible, rank the most relevant and fresh sources based on dates.",
-                "formatting_rules": "Do not provide links as [Page URL](Page URL), always provide a title as this [Page Title](Page URL), if it doesn't just directly send the URL",
-                "formatting_reason": "Now the reason for this is Discord doesn't nicely format the links if you don't provide a title",
-                "showLinks": "No need to list all references, only most relevant ones",
+                **_STATIC_OUTPUT_FIELDS,
                 "results": [],
                 "query": enhanced_query,
                 "search_metadata": {
@@ -885,123 +1219,142 @@ class Tool(ToolManifest):
                 },
             }
 
-            # Score and sort results by quality using advanced scoring
-            scored_results = []
-            for _results in _data["results"]:
-                result_data = {
-                    "title": _results.get("title"),
-                    "url": _results["url"],
-                    "summary": _results.get("summary"),
-                    "highlights": _results.get("highlights"),
-                    "publishedDate": _results.get("publishedDate"),
-                }
-                score = self.result_scorer.score_result(result_data, enhanced_query)
-                scored_results.append((score, result_data))
-
-            # Sort by score (highest first) and take top results
-            scored_results.sort(key=lambda x: x[0], reverse=True)
-            _output["results"] = [
-                result for score, result in scored_results[: params["numResults"]]
+            # Score and sort results by quality using advanced scoring; the
+            # batch API prepares the query context once for all results
+            projected = [
+                {k: _results.get(k) for k in _RESULT_FIELDS}
+                for _results in _data["results"]
             ]
+            scores = self.result_scorer.score_results(projected, enhanced_query)
+
+            # Keep only the top-k by score; nlargest is O(n log k) against a
+            # full O(n log n) sort, and feeding it the lazy zip directly means
+            # only the k survivors are ever materialized as (score, result)
+            # tuples
+            top_results = []
+            for score, result_data in heapq.nlargest(
+                params["numResults"], zip(scores, projected), key=itemgetter(0)
+            ):
+                # Carry the score on the result so downstream formatting
+                # doesn't have to re-run the scorer over the same data
+                result_data["relevance_score"] = score
+                top_results.append(result_data)
+            _output["results"] = top_results
 
             if not _output["results"]:
                 raise Exception("No results fetched from the search response")
 
-            # Cache the results
-            self._cache_search_results(query_hash, _output)
-
             # Format for AI model consumption
             ai_formatted_output = self._format_for_ai_model(_output)
 
-            # Embed that contains first 10 sources
-            _sembed = discord.Embed(title="Web Sources")
+            # Cache the AI-formatted payload rather than the raw output: a
+            # later hit then returns exactly what the miss path returns and
+            # skips re-formatting plus the enhanced-AI round-trip entirely
+            self._cache_search_results(query_hash, ai_formatted_output)
 
-            # Create a more informative response that includes key insights
-            response_text = f"🔍 **Search Results for: {enhanced_query}**\n\n"
+            # Create a more informative response that includes key insights.
+            # Built as a list of parts and joined once; repeated += on a
+            # growing string is quadratic in the final length.
+            parts = [f"🔍 **Search Results for: {enhanced_query}**\n\n"]
 
             # Add comprehensive information from all results
             if _output["results"]:
                 # Always provide key information from the top result
                 top_result = _output["results"][0]
-                response_text += (
+                parts.append(
                     f"**Top Result:** {top_result.get('title', 'No title available')}\n"
                 )
 
                 if top_result.get("summary"):
-                    response_text += f"**Key Finding:** {top_result['summary']}\n\n"
+                    parts.append(f"**Key Finding:** {top_result['summary']}\n\n")
                 else:
                     # If no summary, provide the URL and encourage user to visit
-                    response_text += (
+                    parts.append(
                         f"**Source:** {top_result.get('url', 'No URL available')}\n"
                     )
-                    response_text += (
+                    parts.append(
                         "**Note:** Visit the source for detailed information.\n\n"
                     )
 
                 # Add highlights if available, otherwise use title as key points
                 if top_result.get("highlights"):
                     highlights = top_result["highlights"][:5]  # Top 5 highlights
-                    response_text += "**Key Points:**\n"
+                    parts.append("**Key Points:**\n")
                     for highlight in highlights:
-                        response_text += f"• {highlight}\n"
-                    response_text += "\n"
+                        parts.append(f"• {highlight}\n")
+                    parts.append("\n")
                 else:
                     # Create key points from the title if no highlights
                     title = top_result.get("title", "")
                     if title:
-                        response_text += "**Key Points:**\n"
-                        response_text += f"• {title}\n"
-                        response_text += (
-                            "• Visit the source for comprehensive details\n\n"
-                        )
+                        parts.append("**Key Points:**\n")
+                        parts.append(f"• {title}\n")
+                        parts.append("• Visit the source for comprehensive details\n\n")
+
+                # Build the "Additional Sources" (results 2-4) and "All
+                # Sources" (top 5) sections in one walk over the results
+                # instead of re-slicing and re-reading the same dicts twice.
+                # Plain text format avoids link previews.
+                addl_parts = []
+                source_entries = []
+                for i, result in enumerate(_output["results"][:5], 1):
+                    title = result.get("title")
+                    url = result.get("url", "")
+                    summary = result.get("summary", "")
 
-                # Add information from additional results if available
-                if len(_output["results"]) > 1:
-                    response_text += "**Additional Sources:**\n"
-                    for i, result in enumerate(
-                        _output["results"][1:4], 2
-                    ):  # Results 2-4
-                        title = result.get("title", "Untitled Source")
-                        url = result.get("url", "")
-                        summary = result.get("summary", "")
-
-                        response_text += f"**{i}. {title}**\n"
+                    if 2 <= i <= 4:  # Results 2-4
+                        addl_title = "Untitled Source" if title is None else title
                         if summary:
-                            response_text += f"{summary[:200]}...\n"
+                            addl_parts.append(
+                                _ADDL_WITH_SUMMARY.format(
+                                    i=i, title=addl_title, summary=summary[:200]
+                                )
+                            )
                         else:
-                            response_text += f"Source: {url}\n"
-                        response_text += "\n"
-
-                # Add comprehensive source list with descriptions
-                response_text += "**All Sources:**\n"
-                for i, result in enumerate(_output["results"][:5], 1):  # Top 5 sources
-                    title = result.get("title", "(no title)")
-                    url = result.get("url", "")
-                    summary = result.get("summary", "")
+                            addl_parts.append(
+                                _ADDL_WITH_URL.format(i=i, title=addl_title, url=url)
+                            )
 
-                    # Use plain text format to avoid link previews
-                    response_text += f"{i}. **{title}**\n"
-                    response_text += f"   Source: {url}\n"
+                    src_title = "(no title)" if title is None else title
                     if summary:
-                        response_text += f"   {summary[:150]}...\n"
-                    response_text += "\n"
+                        entry = _SOURCE_WITH_SUMMARY.format(
+                            i=i, title=src_title, url=url, summary=summary[:150]
+                        )
+                    else:
+                        entry = _SOURCE_PLAIN.format(i=i, title=src_title, url=url)
+                    source_entries.append(entry)
+
+                # Add information from additional results if available
+                if len(_output["results"]) > 1:
+                    parts.append("**Additional Sources:**\n")
+                    parts.extend(addl_parts)
+
+                parts.append("**All Sources:**\n" + "\n".join(source_entries) + "\n")
 
                 # Add search metadata and guidance
-                response_text += f"**Search Info:** Found {len(_output['results'])} relevant sources using {params['searchType']} search.\n"
-                response_text += "**Next Steps:** Use the information above to answer your question, or ask me follow-up questions about specific aspects.\n"
-                response_text += "All information above is current and sourced directly from the web."
+                parts.append(
+                    f"**Search Info:** Found {len(_output['results'])} relevant sources using {params['searchType']} search.\n"
+                )
+                parts.append(
+                    "**Next Steps:** Use the information above to answer your question, or ask me follow-up questions about specific aspects.\n"
+                )
+                parts.append(
+                    "All information above is current and sourced directly from the web."
+                )
             else:
-                response_text += "No results found for your query. Try rephrasing or using different keywords."
+                parts.append(
+                    "No results found for your query. Try rephrasing or using different keywords."
+                )
+
+            response_text = "".join(parts)
 
             # Try to use enhanced AI processing if available
             try:
-                from aimodels.enhanced_web_search import (
-                    create_enhanced_web_search_handler,
-                )
-
-                # Check if enhanced AI is enabled in config
-                enhanced_ai_config = self.config.get("enhanced_ai", {})
-                if enhanced_ai_config.get("enabled", True):
+                if create_enhanced_web_search_handler is None:
+                    logging.info(
+                        "Enhanced AI handler not available, using basic search results"
+                    )
+                elif self._enhanced_ai_enabled:
                     # Create enhanced AI handler
                     enhanced_handler = create_enhanced_web_search_handler(
                         self.discord_ctx, self.discord_bot
@@ -1015,12 +1368,8 @@ class Tool(ToolManifest):
                     )
 
                     if enhanced_response and enhanced_response != response_text:
-                        # Convert any markdown links in the enhanced response to plain text
-                        import re
-
                         # Replace markdown links [text](url) with just the text and URL on separate lines
-                        cleaned_response = re.sub(
-                            r"\[([^\]]+)\]\(([^)]+)\)",
+                        cleaned_response = _MD_LINK_RE.sub(
                             r"\1\n   Source: \2",
                             enhanced_response,
                         )
@@ -1031,19 +1380,15 @@ class Tool(ToolManifest):
                         )
                         logging.info("Enhanced AI processing completed successfully")
                         # Return early to avoid sending basic results
-                        await self._track_search_performance(
+                        self._schedule_perf_tracking(
                             enhanced_query, start_time, analysis
                         )
                         return ai_formatted_output
 
-            except ImportError:
-                logging.info(
-                    "Enhanced AI handler not available, using basic search results"
-                )
             except Exception as e:
                 logging.warning(f"Enhanced AI processing failed: {e}")
                 # Check if we should fallback to basic results
-                if not enhanced_ai_config.get("fallback_to_basic", True):
+                if not self._enhanced_ai_fallback:
                     raise e
 
             # Only send basic results if enhanced AI failed or wasn't available
@@ -1066,10 +1411,10 @@ class Tool(ToolManifest):
             )
 
             # Track performance
-            await self._track_search_performance(enhanced_query, start_time, analysis)
+            self._schedule_perf_tracking(enhanced_query, start_time, analysis)
 
             logging.info(
-                f"Web search completed successfully for query: '{enhanced_query}'"
+                "Web search completed successfully for query: '%s'", enhanced_query
             )
             return ai_formatted_output
 
@@ -1082,12 +1427,41 @@ class Tool(ToolManifest):
                 fallback_result = await self._smart_fallback_search(
                     clean_query, e, analysis
                 )
-                await self._track_search_performance(clean_query, start_time, analysis)
+                self._schedule_perf_tracking(clean_query, start_time, analysis)
                 return fallback_result
             except Exception as fallback_e:
                 logging.error(f"Smart fallback search also failed: {fallback_e}")
                 raise e
 
+    async def _tool_function_web_search_many(self, queries: list, **kwargs):
+        """Run several web searches concurrently and collect their results.
+
+        Each query goes through the normal ``_tool_function_web_search``
+        pipeline (cache, bulkhead, retries), but the network latency of the
+        N searches overlaps instead of accumulating, so wall time stays
+        close to that of a single search. Failed queries are reported
+        per-query instead of failing the whole batch.
+        """
+        if not queries:
+            raise ValueError("queries parameter is required and cannot be empty")
+
+        results = await asyncio.gather(
+            *(
+                self._tool_function_web_search(query=query, **kwargs)
+                for query in queries
+            ),
+            return_exceptions=True,
+        )
+
+        output = {}
+        for query, result in zip(queries, results):
+            if isinstance(result, Exception):
+                logging.warning(f"Concurrent web search failed for '{query}': {result}")
+                output[query] = {"error": str(result)}
+            else:
+                output[query] = result
+        return output
+
     # ------------------------------------------------------------------
     # Compatibility alias
     # ------------------------------------------------------------------
@@ -1127,6 +1501,6 @@ class Tool(ToolManifest):
             * 100,
             "average_response_time": self._search_stats["average_response_time"],
             "cache_size": len(self._search_cache),
-            "query_types": self._search_stats["query_types"],
+            "query_types": dict(self._search_stats["query_types"]),
             "success_rate": self._search_stats.get("success_rate", 0.0),
         }
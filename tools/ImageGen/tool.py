@@ -1,4 +1,5 @@
 from .manifest import ToolManifest
+from functools import lru_cache
 from os import environ
 import datetime
 import discord
@@ -7,6 +8,15 @@ import io
 import urllib.parse
 import logging
 
+# Image generation can take a while; timeout object built once per process
+_GENERATION_TIMEOUT = aiohttp.ClientTimeout(total=120)
+
+
+@lru_cache(maxsize=256)
+def _prompt_url(prompt: str) -> str:
+    """Build the Pollinations URL for a prompt, memoized for retried prompts."""
+    return f"https://image.pollinations.ai/prompt/{urllib.parse.quote(prompt)}"
+
 
 class Tool(ToolManifest):
     def __init__(self, method_send, discord_ctx, discord_bot):
@@ -91,28 +101,27 @@ class Tool(ToolManifest):
         # Set model parameter
         params["model"] = model
 
-        # URL encode the prompt
-        encoded_prompt = urllib.parse.quote(prompt)
-
-        # Construct the Pollinations.AI URL
-        base_url = "https://image.pollinations.ai"
-        url = f"{base_url}/prompt/{encoded_prompt}"
-
-        # Create aiohttp session with timeout
-        timeout = aiohttp.ClientTimeout(total=120)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    # For Pollinations.AI, the response URL is the generated image
-                    return url
-                else:
-                    error_text = await response.text()
-                    logging.error(
-                        f"Pollinations.AI image API error: {response.status} - {error_text}"
-                    )
-                    raise Exception(
-                        f"❌ Failed to generate image: HTTP {response.status}"
-                    )
+        # URL-encode the prompt and construct the Pollinations.AI URL
+        url = _prompt_url(prompt)
+
+        # Reuse the bot-wide session (same one the download path uses) so
+        # generation benefits from connection pooling and keep-alive instead
+        # of paying a TCP+TLS handshake per image; only the timeout is per-call
+        session = self.discord_bot._aiohttp_main_client_session
+        async with session.get(
+            url, params=params, timeout=_GENERATION_TIMEOUT
+        ) as response:
+            if response.status == 200:
+                # For Pollinations.AI, the response URL is the generated image
+                return url
+            else:
+                error_text = await response.text()
+                logging.error(
+                    f"Pollinations.AI image API error: {response.status} - {error_text}"
+                )
+                raise Exception(
+                    f"❌ Failed to generate image: HTTP {response.status}"
+                )
 
     async def _download_and_send_image(self, image_url: str) -> discord.Message:
         """Download image from URL and send it to Discord"""
@@ -122,12 +131,17 @@ class Tool(ToolManifest):
             image_url
         ) as response:
             if response.status == 200:
-                _image_data = await response.read()
+                # Stream into the BytesIO instead of response.read(), which
+                # would buffer the whole image as an intermediate bytes object
+                _buffer = io.BytesIO()
+                async for _chunk in response.content.iter_chunked(64 * 1024):
+                    _buffer.write(_chunk)
+                _buffer.seek(0)
 
                 # Send the image
                 _msgID = await self.method_send(
                     file=discord.File(
-                        fp=io.BytesIO(_image_data),
+                        fp=_buffer,
                         filename=f"pollinations_generated_{datetime.datetime.now().strftime('%H_%M_%S_%m%d%Y_%s')}.png",
                     )
                 )
@@ -1,11 +1,59 @@
 from tools.Memory.manifest import ToolManifest
 from core.ai.history import History
 from datetime import datetime, timedelta, timezone
+from cachetools import TTLCache
+from functools import lru_cache
 from os import environ
+import asyncio
 import logging
 import re
 
 
+# Shared fallback History connection, created at most once per process.
+# Motor clients pool their own sockets, so building a fresh client for every
+# Tool instantiation multiplied open TCP connections for no benefit.
+_fallback_history = None
+
+
+def _get_fallback_history(discord_bot) -> History:
+    global _fallback_history
+    if _fallback_history is None:
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        _fallback_history = History(
+            bot=discord_bot,
+            db_conn=AsyncIOMotorClient(environ.get("MONGO_DB_URL")),
+        )
+        logging.info("Memory tool created shared fallback database connection")
+    return _fallback_history
+
+
+# Expiration strings like "7d", "12h", "30m": one fullmatch replaces the old
+# endswith/int-slice chain and its bare except that swallowed unrelated errors
+_DURATION_RE = re.compile(r"(\d+)([dhm])")
+_DURATION_UNITS = {"d": "days", "h": "hours", "m": "minutes"}
+
+
+# Exact-match recall cache, shared process-wide since Tool instances are
+# rebuilt per invocation. Repeated queries within a conversation ("my name",
+# "favorite color") skip the Mongo cascade entirely; the short TTL plus the
+# eager invalidation in remember_fact keep results fresh.
+_recall_cache = TTLCache(maxsize=512, ttl=60)
+
+
+def _invalidate_recall_cache(guild_id: int):
+    """Drop cached recall responses for a guild after a write."""
+    for key in [k for k in _recall_cache if k[0] == guild_id]:
+        _recall_cache.pop(key, None)
+
+
+@lru_cache(maxsize=128)
+def _category_pattern(category: str) -> str:
+    """Anchored, escaped category-prefix pattern sent to Mongo, memoized
+    per category so repeated listings skip the escape + format work."""
+    return f"^\\[{re.escape(category)}\\]"
+
+
 class Tool(ToolManifest):
     # Required attributes for bot system recognition
     tool_human_name = "Memory Recall"
@@ -17,9 +65,9 @@ class Tool(ToolManifest):
         self.discord_bot = discord_bot
         self.history_db = None
 
-        # Set the schema attributes for this instance
-        self.tool_schema = self.tool_schema_basic
-        self.tool_schema_openai = self.tool_schema_openai
+        # Collection handles resolved once per guild; PyMongo's __getitem__
+        # builds a fresh Collection wrapper (plus the f-string) on every call
+        self._collection_cache = {}
 
         # Try to get the shared database connection from the bot
         # This is the proper way to access the shared database connection
@@ -35,20 +83,34 @@ class Tool(ToolManifest):
                     self.history_db = misc_cog.DBConn
                     logging.info("Memory tool using database connection from Misc cog")
                 else:
-                    # Last resort: create a new connection
-                    from core.services.helperfunctions import HelperFunctions
-                    from motor.motor_asyncio import AsyncIOMotorClient
-                    from os import environ
-
-                    db_conn = AsyncIOMotorClient(environ.get("MONGO_DB_URL"))
-                    self.history_db = History(bot=discord_bot, db_conn=db_conn)
-                    logging.info("Memory tool created new database connection")
+                    # Last resort: use the process-wide fallback connection
+                    self.history_db = _get_fallback_history(discord_bot)
+                    logging.info("Memory tool using fallback database connection")
             except Exception as e:
                 logging.error(
                     f"Failed to initialize Memory tool database connection: {e}"
                 )
                 self.history_db = None
 
+    def _scope(self) -> tuple:
+        """Resolve (guild_id, user_id) once per call using the same logic as
+        the chat system; DMs always fall back to the author since ctx.guild
+        is None there."""
+        author_id = self.discord_ctx.author.id
+        if environ.get("SHARED_CHAT_HISTORY", "false").lower() == "true":
+            guild = self.discord_ctx.guild
+            return (guild.id if guild else author_id, author_id)
+        return (author_id, author_id)
+
+    def _knowledge_coll(self, guild_id: int):
+        """Return the knowledge collection for a guild, caching the handle."""
+        coll = self._collection_cache.get(guild_id)
+        if coll is None:
+            coll = self._collection_cache[guild_id] = self.history_db._db[
+                f"knowledge_{guild_id}"
+            ]
+        return coll
+
     async def _tool_function_remember_fact(
         self, fact: str, category: str = None, expires_in: str = None
     ):
@@ -57,17 +119,7 @@ class Tool(ToolManifest):
             return "❌ Memory system is not available at the moment"
 
         try:
-            # Determine guild/user ID using the same logic as the chat system
-            if environ.get("SHARED_CHAT_HISTORY", "false").lower() == "true":
-                guild_id = (
-                    self.discord_ctx.guild.id
-                    if self.discord_ctx.guild
-                    else self.discord_ctx.author.id
-                )  # Always fallback to ctx.author.id for DMs since ctx.guild is None
-            else:
-                guild_id = self.discord_ctx.author.id
-
-            user_id = self.discord_ctx.author.id
+            guild_id, user_id = self._scope()
 
             # Get username for prepending to fact
             username = self.discord_ctx.author.display_name or f"User{user_id}"
@@ -75,21 +127,12 @@ class Tool(ToolManifest):
             # Parse expiration time
             expires_at = None
             if expires_in and expires_in.lower() != "never":
-                try:
-                    now = datetime.now(timezone.utc)
-                    if expires_in.endswith("d"):
-                        days = int(expires_in[:-1])
-                        expires_at = now + timedelta(days=days)
-                    elif expires_in.endswith("h"):
-                        hours = int(expires_in[:-1])
-                        expires_at = now + timedelta(hours=hours)
-                    elif expires_in.endswith("m"):
-                        minutes = int(expires_in[:-1])
-                        expires_at = now + timedelta(minutes=minutes)
-                    else:
-                        raise ValueError("Invalid time format")
-                except:
+                match = _DURATION_RE.fullmatch(expires_in.strip())
+                if not match:
                     return "⚠️ Invalid expiration format. Use number followed by d, h, or m (e.g., 1d, 2h, 30m), or 'never' for permanent"
+                expires_at = datetime.now(timezone.utc) + timedelta(
+                    **{_DURATION_UNITS[match.group(2)]: int(match.group(1))}
+                )
 
             # Prepend username to fact text to associate information with specific user
             fact_with_user = f"[{username}] {fact}"
@@ -100,22 +143,19 @@ class Tool(ToolManifest):
             else:
                 fact_with_category = fact_with_user
 
-            # Store the fact
-            fact_id = await self.history_db.add_fact(
+            # Store the fact; the structured category field lets listing
+            # filter with an indexed equality instead of a prefix regex
+            await self.history_db.add_fact(
                 guild_id=guild_id,
                 user_id=user_id,
                 fact_text=fact_with_category,
                 source=f"memory_tool/{user_id}",
                 expires_at=expires_at,
+                category=category.lower() if category else None,
             )
 
-            response = f"✅ I'll remember that: **{fact}**"
-            if category:
-                response += f" (Category: {category})"
-            if expires_at:
-                response += f"\n⏰ Expires: {expires_at.strftime('%Y-%m-%d %H:%M')} UTC"
-            else:
-                response += " (Permanent)"
+            # New facts must be recallable immediately
+            _invalidate_recall_cache(guild_id)
 
             # Return a natural response that the AI can use
             return f"I've remembered that {fact}. This information is now stored in my memory for future conversations."
@@ -130,33 +170,30 @@ class Tool(ToolManifest):
             return "❌ Memory system is not available at the moment"
 
         try:
-            # Determine guild/user ID using the same logic as the chat system
-            if environ.get("SHARED_CHAT_HISTORY", "false").lower() == "true":
-                guild_id = (
-                    self.discord_ctx.guild.id
-                    if self.discord_ctx.guild
-                    else self.discord_ctx.author.id
-                )  # Always fallback to ctx.author.id for DMs since ctx.guild is None
-            else:
-                guild_id = self.discord_ctx.author.id
-
-            current_user_id = self.discord_ctx.author.id
+            guild_id, current_user_id = self._scope()
 
             # Limit the search results
             limit = min(max(1, limit), 10)
 
+            # Serve repeat queries from the exact-match cache
+            cache_key = (guild_id, current_user_id, query.strip().casefold(), limit)
+            cached_response = _recall_cache.get(cache_key)
+            if cached_response is not None:
+                return cached_response
+
             # NEW: Search global facts first (guild_id = 0)
             global_facts = []
+            now = datetime.now(timezone.utc)
             try:
-                global_collection = self.history_db._db["knowledge_0"]
-                # Search for global facts that match the query
-                async for fact in global_collection.find(
-                    {"$text": {"$search": query}}
-                ).limit(limit):
-                    if fact and (
-                        fact.get("expires_at") is None
-                        or fact["expires_at"] > datetime.now(timezone.utc)
-                    ):
+                global_collection = self._knowledge_coll(0)
+                # Search for global facts that match the query; to_list pulls
+                # the batch in one awaitable instead of one loop tick per doc
+                global_docs = await global_collection.find(
+                    {"$text": {"$search": query}},
+                    {"fact_text": 1, "expires_at": 1, "_id": 0},
+                ).to_list(length=limit)
+                for fact in global_docs:
+                    if fact.get("expires_at") is None or fact["expires_at"] > now:
                         # Check if this is a public global fact
                         fact_text = fact.get("fact_text", "")
                         if "[SYSTEM_GLOBAL]" in fact_text:
@@ -164,68 +201,65 @@ class Tool(ToolManifest):
             except Exception as e:
                 logging.debug(f"Global fact search failed: {e}")
 
-            # FIRST PRIORITY: Search for facts created by the current user
-            user_facts = await self.history_db.search_facts_by_user(
-                guild_id, current_user_id, query, limit=limit
+            # Run both search tiers concurrently instead of paying two
+            # sequential Mongo round-trips; first-wins selection below
+            # preserves the old priority order (user search > all search).
+            # The recency getters the old cascade fell through to never fed
+            # the combined output, so they are not queried at all.
+            tier_results = await asyncio.gather(
+                self.history_db.search_facts_by_user(
+                    guild_id, current_user_id, query, limit=limit
+                ),
+                self.history_db.search_facts(guild_id, query, limit=limit),
+                return_exceptions=True,
             )
+            user_facts, all_facts = [
+                [] if isinstance(r, Exception) else r for r in tier_results
+            ]
 
-            # SECOND PRIORITY: If no user-specific facts found, search all facts
-            all_facts = []
-            if not user_facts:
-                all_facts = await self.history_db.search_facts(
-                    guild_id, query, limit=limit
-                )
+            # First non-empty tier wins; the lower tier is discarded
+            if user_facts:
+                all_facts = []
 
-            # THIRD PRIORITY: If still no facts, get recent facts by the current user
-            recent_user_facts = []
-            if not user_facts and not all_facts:
-                recent_user_facts = await self.history_db.get_facts_by_user(
-                    guild_id, current_user_id, limit=limit
-                )
-
-            # FOURTH PRIORITY: If still nothing, get recent facts from anyone
-            recent_all_facts = []
-            if not user_facts and not all_facts and not recent_user_facts:
-                recent_all_facts = await self.history_db.get_recent_facts(
-                    guild_id, limit=limit
-                )
+            # Combine all facts with priority: global facts first, then user
+            # facts, then others. setdefault on an insertion-ordered dict
+            # dedupes in O(1) per fact instead of rescanning the list.
+            combined = {}
 
-            # Combine all facts with priority: global facts first, then user facts, then others
-            all_relevant_facts = []
-            
             # Add global facts first
             for fact in global_facts:
                 # Clean up the fact text for display
                 clean_fact = fact.replace("[SYSTEM_GLOBAL]", "").replace("[SYSTEM_PRIVATE]", "")
-                if clean_fact not in [f[0] for f in all_relevant_facts]:
-                    all_relevant_facts.append((clean_fact, "global knowledge base"))
+                combined.setdefault(clean_fact, "global knowledge base")
 
             # Add user facts
             for fact in user_facts:
-                if fact not in [f[0] for f in all_relevant_facts]:
-                    all_relevant_facts.append((fact, "your personal memory"))
+                combined.setdefault(fact, "your personal memory")
 
             # Add general facts
             for fact in all_facts:
-                if fact not in [f[0] for f in all_relevant_facts]:
-                    all_relevant_facts.append((fact, "general memory"))
+                combined.setdefault(fact, "general memory")
 
             # Limit to requested number
-            all_relevant_facts = all_relevant_facts[:limit]
+            all_relevant_facts = list(combined.items())[:limit]
 
             if not all_relevant_facts:
-                return f"🤔 I couldn't find any facts matching '{query}' in my memory"
-
+                response = (
+                    f"🤔 I couldn't find any facts matching '{query}' in my memory"
+                )
             # Format the response with source information
-            if len(all_relevant_facts) == 1:
+            elif len(all_relevant_facts) == 1:
                 fact_text, source_info = all_relevant_facts[0]
-                return f"I found this information in my memory from {source_info}: {fact_text}"
+                response = f"I found this information in my memory from {source_info}: {fact_text}"
             else:
                 facts_with_sources = []
                 for fact_text, source_info in all_relevant_facts:
                     facts_with_sources.append(f"{fact_text} (from {source_info})")
                 facts_text = "; ".join(facts_with_sources)
-                return f"I found these details in my memory: {facts_text}"
+                response = f"I found these details in my memory: {facts_text}"
+
+            _recall_cache[cache_key] = response
+            return response
 
         except Exception as e:
             logging.error(f"Error recalling facts: {e}")
@@ -237,61 +271,73 @@ class Tool(ToolManifest):
             return "❌ Memory system is not available at the moment"
 
         try:
-            # Determine guild/user ID using the same logic as the chat system
-            if environ.get("SHARED_CHAT_HISTORY", "false").lower() == "true":
-                guild_id = (
-                    self.discord_ctx.guild.id
-                    if self.discord_ctx.guild
-                    else self.discord_ctx.author.id
-                )  # Always fallback to ctx.author.id for DMs since ctx.guild is None
-            else:
-                guild_id = self.discord_ctx.author.id
-
-            current_user_id = self.discord_ctx.author.id
+            guild_id, current_user_id = self._scope()
 
             # Limit the results
             limit = min(max(1, limit), 20)
 
             # Get facts from the knowledge base
-            knowledge_collection = self.history_db._db[f"knowledge_{guild_id}"]
-
-            # Build query - prioritize current user's facts
-            query = {}
-            if category:
-                query["fact_text"] = {
-                    "$regex": f"^\\[{re.escape(category)}\\]",
-                    "$options": "i",
+            knowledge_collection = self._knowledge_coll(guild_id)
+
+            # Build query - prioritize current user's facts. Expired facts
+            # are excluded server-side; the TTL index purges them anyway, so
+            # this only covers the window before the next server sweep.
+            conditions = [
+                {
+                    "$or": [
+                        {"expires_at": None},
+                        {"expires_at": {"$gt": datetime.now(timezone.utc)}},
+                    ]
                 }
-
-            # Get facts - prioritize current user
-            facts = []
-
-            # First get facts by current user
-            user_query = query.copy()
-            user_query["user_id"] = current_user_id
-
-            async for fact in knowledge_collection.find(user_query).limit(limit):
-                if fact and (
-                    fact.get("expires_at") is None
-                    or fact["expires_at"] > datetime.now(timezone.utc)
-                ):
-                    facts.append(fact["fact_text"])
-
-            # If we need more facts and category is specified, get other users' facts in that category
-            if len(facts) < limit and category:
-                other_query = query.copy()
-                other_query["user_id"] = {"$ne": current_user_id}
-
-                async for fact in knowledge_collection.find(other_query).limit(
-                    limit - len(facts)
-                ):
-                    if fact and (
-                        fact.get("expires_at") is None
-                        or fact["expires_at"] > datetime.now(timezone.utc)
-                    ):
-                        fact_text = fact["fact_text"]
-                        if fact_text not in facts:  # Avoid duplicates
-                            facts.append(fact_text)
+            ]
+            if category:
+                # New facts carry a structured category field (indexed
+                # equality); older facts only have the [category] prefix in
+                # fact_text, so keep the regex as a fallback arm
+                conditions.append(
+                    {
+                        "$or": [
+                            {"category": category.lower()},
+                            {
+                                "fact_text": {
+                                    "$regex": _category_pattern(category),
+                                    "$options": "i",
+                                }
+                            },
+                        ]
+                    }
+                )
+            query = {"$and": conditions}
+
+            # Other users' facts are only listed when a category is given,
+            # matching the old two-query behavior
+            if not category:
+                query["user_id"] = current_user_id
+
+            # Get facts in one aggregation - current user's facts sort first,
+            # replacing the previous two sequential find() round-trips
+            pipeline = [
+                {"$match": query},
+                {
+                    "$addFields": {
+                        "_pri": {
+                            "$cond": [{"$eq": ["$user_id", current_user_id]}, 0, 1]
+                        }
+                    }
+                },
+                {"$sort": {"_pri": 1}},
+                {"$limit": limit},
+                {"$project": {"fact_text": 1, "_id": 0}},
+            ]
+
+            # Dedupe with an insertion-ordered dict: O(1) membership instead
+            # of scanning the list for every document
+            seen = {}
+            for fact in await knowledge_collection.aggregate(pipeline).to_list(
+                length=limit
+            ):
+                seen.setdefault(fact["fact_text"], None)
+            facts = list(seen)
 
             if not facts:
                 if category:
@@ -299,20 +345,6 @@ class Tool(ToolManifest):
                 else:
                     return "🤔 I don't have any facts stored in my memory yet"
 
-            # Format the response
-            if category:
-                response = (
-                    f"📋 Facts in category '{category}' (prioritizing your facts):\n"
-                )
-            else:
-                response = f"📋 All facts in my memory (prioritizing your facts):\n"
-
-            for i, fact in enumerate(facts, 1):
-                response += f"{i}. {fact}\n"
-
-            if len(facts) == limit:
-                response += f"\n... and more (showing first {limit})"
-
             # Return the facts in a natural format for the AI to use
             if len(facts) == 1:
                 return f"I have one fact stored: {facts[0]}"
@@ -330,17 +362,7 @@ class Tool(ToolManifest):
             return "❌ Memory system is not available at the moment"
 
         try:
-            # Determine guild/user ID using the same logic as the chat system
-            if environ.get("SHARED_CHAT_HISTORY", "false").lower() == "true":
-                guild_id = (
-                    self.discord_ctx.guild.id
-                    if self.discord_ctx.guild
-                    else self.discord_ctx.author.id
-                )  # Always fallback to ctx.author.id for DMs since ctx.guild is None
-            else:
-                guild_id = self.discord_ctx.author.id
-
-            current_user_id = self.discord_ctx.author.id
+            guild_id, current_user_id = self._scope()
 
             # Limit the results
             limit = min(max(1, limit), 20)
@@ -353,14 +375,6 @@ class Tool(ToolManifest):
             if not facts:
                 return "🤔 You haven't told me any facts to remember yet."
 
-            # Format the response
-            response = f"📋 Facts you've told me to remember:\n"
-            for i, fact in enumerate(facts, 1):
-                response += f"{i}. {fact}\n"
-
-            if len(facts) == limit:
-                response += f"\n... and more (showing first {limit})"
-
             # Return the facts in a natural format for the AI to use
             if len(facts) == 1:
                 return f"You've told me one fact: {facts[0]}"
@@ -378,17 +392,7 @@ class Tool(ToolManifest):
             return "❌ Memory system is not available at the moment"
 
         try:
-            # Determine guild/user ID using the same logic as the chat system
-            if environ.get("SHARED_CHAT_HISTORY", "false").lower() == "true":
-                guild_id = (
-                    self.discord_ctx.guild.id
-                    if self.discord_ctx.guild
-                    else self.discord_ctx.author.id
-                )  # Always fallback to ctx.author.id for DMs since ctx.guild is None
-            else:
-                guild_id = self.discord_ctx.author.id
-
-            current_user_id = self.discord_ctx.author.id
+            guild_id, current_user_id = self._scope()
 
             # Search for facts by current user that match the query
             user_facts = await self.history_db.search_facts_by_user(
@@ -404,10 +408,15 @@ class Tool(ToolManifest):
             if len(user_facts) == 1:
                 response = f"📝 I found this fact you created: **{user_facts[0]}**\n\n*Note: Fact deletion is not yet implemented, but I can see what you want me to forget.*"
             else:
-                response = f"📝 I found these facts you created matching '{query}':\n"
-                for i, fact in enumerate(user_facts, 1):
-                    response += f"{i}. **{fact}**\n"
-                response += "\n*Note: Fact deletion is not yet implemented, but I can see what you want me to forget.*"
+                # Joined once instead of growing the string per fact
+                parts = [f"📝 I found these facts you created matching '{query}':\n"]
+                parts.extend(
+                    f"{i}. **{fact}**\n" for i, fact in enumerate(user_facts, 1)
+                )
+                parts.append(
+                    "\n*Note: Fact deletion is not yet implemented, but I can see what you want me to forget.*"
+                )
+                response = "".join(parts)
 
             return response
 